@@ -3,25 +3,53 @@
 
 import argparse
 import json
+import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-import yaml
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from saas_bench.domains.databricks.registry import TOOL_REGISTRY
-from saas_bench.tutorial_processor.scraper import scrape_tutorial
-from saas_bench.tutorial_processor.workflow_extractor import extract_workflow
+from saas_bench.tutorial_processor.scraper import (
+    DEFAULT_CACHE_DIR,
+    scrape_tutorial,
+    scrape_tutorial_cached,
+)
+from saas_bench.tutorial_processor.workflow_extractor import (
+    Workflow,
+    extract_workflow,
+)
 from saas_bench.tutorial_processor.workflow_serializer import (
     generate_workflow_filename,
     serialize_to_yaml,
 )
 
 
+# Tool-name substrings that imply the workflow touches a resource type
+TOOL_KEYWORD_RESOURCES = {
+    "catalog": "catalogs",
+    "schema": "schemas",
+    "table": "tables",
+    "notebook": "notebooks",
+    "cluster": "clusters",
+    "job": "jobs",
+    "volume": "volumes",
+    "privilege": "permissions",
+    "permission": "permissions",
+}
+TOOL_KEYWORD_RE = re.compile("|".join(TOOL_KEYWORD_RESOURCES))
+
+
 def analyze_resource_types(workflow_dict: Dict) -> Dict[str, Set[str]]:
     """Extract resource types and their properties from a workflow."""
     resources = defaultdict(set)
@@ -57,28 +85,66 @@ def analyze_resource_types(workflow_dict: Dict) -> Dict[str, Set[str]]:
             resources["_tools"].add(tool_name)
 
             # Infer resource types from tool names
-            if "catalog" in tool_name:
-                resources["catalogs"].add("_inferred_from_tool")
-            if "schema" in tool_name:
-                resources["schemas"].add("_inferred_from_tool")
-            if "table" in tool_name:
-                resources["tables"].add("_inferred_from_tool")
-            if "notebook" in tool_name:
-                resources["notebooks"].add("_inferred_from_tool")
-            if "cluster" in tool_name:
-                resources["clusters"].add("_inferred_from_tool")
-            if "job" in tool_name:
-                resources["jobs"].add("_inferred_from_tool")
-            if "volume" in tool_name:
-                resources["volumes"].add("_inferred_from_tool")
-            if "privilege" in tool_name or "permission" in tool_name:
-                resources["permissions"].add("_inferred_from_tool")
+            for keyword in TOOL_KEYWORD_RE.findall(tool_name):
+                resources[TOOL_KEYWORD_RESOURCES[keyword]].add("_inferred_from_tool")
 
     return dict(resources)
 
 
+def scrape_all(
+    urls: List[str],
+    max_workers: int = 8,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    max_age: Optional[float] = None,
+) -> Tuple[Dict[str, str | Exception], int]:
+    """Scrape tutorials concurrently, mapping each URL to its text or the error raised.
+
+    Returns:
+        Tuple of (scraped tutorials by URL, number of cache hits)
+    """
+    scraped: Dict[str, str | Exception] = {}
+    cache_hits = 0
+    unique_urls = list(dict.fromkeys(urls))
+    if not unique_urls:
+        return scraped, cache_hits
+
+    def scrape(url: str) -> Tuple[str, bool]:
+        if cache_dir is None:
+            return scrape_tutorial(url), False
+        return scrape_tutorial_cached(url, cache_dir, max_age=max_age, refresh=refresh)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+        futures = {executor.submit(scrape, url): url for url in unique_urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                scraped[url], cache_hit = future.result()
+                cache_hits += cache_hit
+            except Exception as e:
+                scraped[url] = e
+
+    return scraped, cache_hits
+
+
+def extract_one(tutorial: str | Exception, url: str, output_dir: str) -> Workflow:
+    """Extract a workflow from scraped tutorial text, re-raising any scrape error.
+
+    The workflow already has its ID: extract_workflow reserves one per call.
+    """
+    if isinstance(tutorial, Exception):
+        raise tutorial
+    return extract_workflow(tutorial, url, output_dir)
+
+
 def process_tutorials_batch(
-    urls: List[str], output_dir: str = "workflows/databricks"
+    urls: List[str],
+    output_dir: str = "workflows/databricks",
+    scrape_workers: int = 8,
+    jobs: int = 1,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    refresh: bool = False,
+    cache_ttl: Optional[float] = None,
 ) -> Dict:
     """Process multiple tutorials and analyze resource types."""
     print(f"Processing {len(urls)} tutorials...\n")
@@ -88,56 +154,67 @@ def process_tutorials_batch(
     workflows_processed = []
     errors = []
 
-    for i, url in enumerate(urls, 1):
-        print(f"[{i}/{len(urls)}] Processing: {url}")
-        try:
-            # Scrape tutorial
-            tutorial_text = scrape_tutorial(url)
-
-            # Extract workflow
-            workflow = extract_workflow(tutorial_text, url, output_dir)
-
-            # Serialize to YAML
-            output_path = generate_workflow_filename(workflow, output_dir)
-            serialize_to_yaml(workflow, output_path)
-
-            # Analyze resource types
-            workflow_dict = workflow.model_dump()
-            resources = analyze_resource_types(workflow_dict)
-
-            # Aggregate resources
-            for resource_type, properties in resources.items():
-                all_resources[resource_type].update(properties)
-
-            # Track tools
-            all_tools.update(resources.get("_tools", set()))
-
-            workflows_processed.append(
-                {
-                    "url": url,
-                    "workflow_id": workflow.id,
-                    "title": workflow.title,
-                    "output_path": output_path,
-                    "resources_found": list(resources.keys()),
-                }
-            )
-
-            print(f"  ✓ Processed: {workflow.title}")
-            print(
-                f"    Resources: {', '.join([r for r in resources.keys() if not r.startswith('_')])}"
-            )
-            print()
-
-        except Exception as e:
-            error_msg = f"Error processing {url}: {e}"
-            print(f"  ✗ {error_msg}\n")
-            errors.append({"url": url, "error": str(e)})
+    # Scraping is network-bound, so fetch every page up front in parallel
+    scraped, cache_hits = scrape_all(
+        urls, scrape_workers, cache_dir=cache_dir, refresh=refresh, max_age=cache_ttl
+    )
+    if cache_dir is not None:
+        print(f"Tutorial cache: {cache_hits} hit(s), {len(scraped) - cache_hits} miss(es)\n")
+
+    # Extraction is dominated by LLM round-trips; with jobs=1 this runs serially
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [
+            executor.submit(extract_one, scraped[url], url, output_dir)
+            for url in urls
+        ]
+
+        for i, (url, future) in enumerate(zip(urls, futures), 1):
+            print(f"[{i}/{len(urls)}] Processing: {url}")
+            try:
+                # Extract workflow
+                workflow = future.result()
+
+                # Serialize to YAML
+                output_path = generate_workflow_filename(workflow, output_dir)
+                serialize_to_yaml(workflow, output_path)
+
+                # Analyze resource types
+                workflow_dict = workflow.model_dump()
+                resources = analyze_resource_types(workflow_dict)
+
+                # Aggregate resources
+                for resource_type, properties in resources.items():
+                    all_resources[resource_type].update(properties)
+
+                # Track tools
+                all_tools.update(resources.get("_tools", set()))
+
+                workflows_processed.append(
+                    {
+                        "url": url,
+                        "workflow_id": workflow.id,
+                        "title": workflow.title,
+                        "output_path": output_path,
+                        "resources_found": list(resources.keys()),
+                    }
+                )
+
+                print(f"  ✓ Processed: {workflow.title}")
+                print(
+                    f"    Resources: {', '.join([r for r in resources.keys() if not r.startswith('_')])}"
+                )
+                print()
+
+            except Exception as e:
+                error_msg = f"Error processing {url}: {e}"
+                print(f"  ✗ {error_msg}\n")
+                errors.append({"url": url, "error": str(e)})
 
     return {
         "workflows_processed": workflows_processed,
         "errors": errors,
         "resource_types": {
-            k: list(v) for k, v in all_resources.items() if not k.startswith("_")
+            k: v for k, v in all_resources.items() if not k.startswith("_")
         },
         "tools_used": sorted(all_tools),
         "summary": {
@@ -152,6 +229,16 @@ def process_tutorials_batch(
     }
 
 
+def write_json(path: str, data: Dict) -> None:
+    """Write data as indented JSON, emitting sets as sorted lists."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=sorted))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, default=sorted)
+
+
 def generate_schema_recommendations(analysis: Dict) -> str:
     """Generate recommendations for schema extensions."""
     current_schema_types = {
@@ -227,11 +314,52 @@ def main():
         default="schema_recommendations.md",
         help="Output file for schema recommendations (default: schema_recommendations.md, only used with --analyze)",
     )
+    parser.add_argument(
+        "--scrape-workers",
+        type=int,
+        default=8,
+        help="Maximum number of tutorials to fetch concurrently (default: 8)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of workflows to extract in parallel (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for cached tutorial text (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch tutorials from the network without touching the cache",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch every tutorial and overwrite its cached copy",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Maximum age of cached tutorials in seconds (default: never expire)",
+    )
 
     args = parser.parse_args()
 
     # Process all tutorials
-    analysis = process_tutorials_batch(args.urls, args.output_dir)
+    analysis = process_tutorials_batch(
+        args.urls,
+        args.output_dir,
+        scrape_workers=args.scrape_workers,
+        jobs=args.jobs,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        refresh=args.refresh,
+        cache_ttl=args.cache_ttl,
+    )
 
     # Print basic summary
     print("=" * 60)
@@ -247,8 +375,7 @@ def main():
     # If analysis requested, generate detailed analysis
     if args.analyze:
         # Save analysis
-        with open(args.analysis_output, "w") as f:
-            json.dump(analysis, f, indent=2)
+        write_json(args.analysis_output, analysis)
 
         # Generate recommendations
         recommendations = generate_schema_recommendations(analysis)
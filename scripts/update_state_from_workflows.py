@@ -2,15 +2,15 @@
 """Analyze workflows and update state.py schema based on findings."""
 
 import argparse
+import dataclasses
 import inspect
 import json
+import os
 import sys
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
-
-import yaml
-from pydantic import BaseModel
+from typing import Any, Container, Dict, Iterator, List, Optional, Set, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -26,11 +26,64 @@ from saas_bench.domains.databricks.state import (
     Schema,
     Table,
 )
-from saas_bench.utils.yaml_loader import load_all_workflows
+from saas_bench.tutorial_processor.workflow_extractor import Workflow
+from saas_bench.utils.yaml_loader import load_workflow
+
+
+def load_workflow_file(path: Path) -> Optional[Workflow]:
+    """Load a single workflow file, reporting errors instead of raising them."""
+    try:
+        return load_workflow(path)
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
 
 
-def get_pydantic_fields(model_class: type[BaseModel]) -> Dict[str, Any]:
-    """Extract field information from a Pydantic model."""
+def load_workflows_parallel(workflows_dir: Path, jobs: int) -> List[Workflow]:
+    """Load every workflow YAML in a directory, parsing files across worker processes."""
+    paths = sorted(workflows_dir.glob("*.yaml"))
+    workers = min(jobs, len(paths))
+
+    if workers <= 1:
+        results = [load_workflow_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(load_workflow_file, paths))
+
+    return [workflow for workflow in results if workflow is not None]
+
+
+# State resource keys and the models that define them
+RESOURCE_TYPE_MAPPING: Dict[str, type] = {
+    "catalogs": Catalog,
+    "schemas": Schema,
+    "tables": Table,
+    "notebooks": Notebook,
+    "clusters": Cluster,
+    "jobs": Job,
+    "permissions": Permission,
+}
+
+
+@lru_cache(maxsize=None)
+def get_pydantic_fields(model_class: type) -> Dict[str, Any]:
+    """Extract field information from a Pydantic model or dataclass.
+
+    Cached per model class; callers must not mutate the returned dict.
+    """
+    if dataclasses.is_dataclass(model_class):
+        return {
+            field.name: {
+                "type": str(field.type),
+                "required": field.default is dataclasses.MISSING
+                and field.default_factory is dataclasses.MISSING,
+                "default": None
+                if field.default is dataclasses.MISSING
+                else field.default,
+            }
+            for field in dataclasses.fields(model_class)
+        }
+
     fields = {}
     for field_name, field_info in model_class.model_fields.items():
         fields[field_name] = {
@@ -41,131 +94,96 @@ def get_pydantic_fields(model_class: type[BaseModel]) -> Dict[str, Any]:
     return fields
 
 
+# Exact-type lookup; bool maps correctly because type(True) is bool, not int
+SCALAR_TYPE_NAMES = {bool: "bool", int: "int", float: "float", str: "str"}
+
+
 def infer_python_type(value: Any) -> str:
     """Infer Python type from a value."""
+    value_type = type(value)
+    type_name = SCALAR_TYPE_NAMES.get(value_type)
+    if type_name is not None:
+        return type_name
     if value is None:
         return "Optional[Any]"
-    elif isinstance(value, bool):
-        return "bool"
-    elif isinstance(value, int):
-        return "int"
-    elif isinstance(value, float):
-        return "float"
-    elif isinstance(value, str):
-        return "str"
-    elif isinstance(value, list):
+    if value_type is list:
         if value:
-            item_type = infer_python_type(value[0])
-            return f"List[{item_type}]"
+            return f"List[{infer_python_type(value[0])}]"
         return "List[Any]"
-    elif isinstance(value, dict):
+    if value_type is dict:
         return "Dict[str, Any]"
-    else:
-        return type(value).__name__
-
 
-def extract_resource_properties(
-    state_dict: Dict, resource_type: str
-) -> Dict[str, Set[str]]:
-    """Extract properties used for a specific resource type from state dict."""
-    properties = defaultdict(set)
-
-    if resource_type not in state_dict:
-        return {}
-
-    resources = state_dict[resource_type]
-    if not isinstance(resources, dict):
-        return {}
-
-    for resource_key, resource_data in resources.items():
-        if isinstance(resource_data, dict):
-            for prop_name, prop_value in resource_data.items():
-                properties[prop_name].add(infer_python_type(prop_value))
-
-    return dict(properties)
+    # Subclasses of the builtin types fall back to the isinstance checks
+    for base_type, base_name in SCALAR_TYPE_NAMES.items():
+        if isinstance(value, base_type):
+            return base_name
+    if isinstance(value, list):
+        return f"List[{infer_python_type(value[0])}]" if value else "List[Any]"
+    if isinstance(value, dict):
+        return "Dict[str, Any]"
+    return value_type.__name__
+
+
+def collect_state_properties(
+    state_dict: Dict,
+    resource_types: Container[str],
+    found_types: Dict[str, None],
+    property_types: Dict[Tuple[str, str], Set[str]],
+) -> None:
+    """Record property types for every resource type present in a state dict.
+
+    Resource types are recorded in ``found_types`` in first-seen order, and
+    the types seen for each property in ``property_types`` keyed by
+    ``(resource_type, prop_name)``. Keys outside ``resource_types`` (other
+    than ``active_catalog``) are recorded too, so new resource types are
+    discovered in the same pass.
+    """
+    for resource_type, resources in state_dict.items():
+        if resource_type not in resource_types:
+            if resource_type == "active_catalog":
+                continue
+            # Potentially new resource types are reported even when they
+            # carry no properties
+            found_types.setdefault(resource_type)
+        if not isinstance(resources, dict):
+            continue
+        for resource_data in resources.values():
+            if isinstance(resource_data, dict):
+                for prop_name, prop_value in resource_data.items():
+                    key = (resource_type, prop_name)
+                    types = property_types.get(key)
+                    if types is None:
+                        types = property_types[key] = set()
+                        found_types.setdefault(resource_type)
+                    types.add(infer_python_type(prop_value))
 
 
 def analyze_workflow_states(workflows: List) -> Dict[str, Dict]:
     """Analyze all workflows to extract resource types and properties."""
-    found_resources = defaultdict(lambda: defaultdict(set))
-    resource_type_mapping = {
-        "catalogs": Catalog,
-        "schemas": Schema,
-        "tables": Table,
-        "notebooks": Notebook,
-        "clusters": Cluster,
-        "jobs": Job,
-        "permissions": Permission,
-    }
+    found_types: Dict[str, None] = {}
+    property_types: Dict[Tuple[str, str], Set[str]] = {}
 
     for workflow in workflows:
-        # Analyze initial_state
-        if workflow.initial_state:
-            for resource_type in resource_type_mapping.keys():
-                props = extract_resource_properties(
-                    workflow.initial_state, resource_type
+        # Walk only the keys each state dict actually contains, rather than
+        # probing it once per known resource type
+        state_dicts = [workflow.initial_state, workflow.goal_state]
+        state_dicts.extend(step.expected_state_change for step in workflow.steps)
+        for state_dict in state_dicts:
+            if state_dict:
+                collect_state_properties(
+                    state_dict, RESOURCE_TYPE_MAPPING, found_types, property_types
                 )
-                for prop_name, types in props.items():
-                    found_resources[resource_type][prop_name].update(types)
 
-        # Analyze goal_state
-        if workflow.goal_state:
-            for resource_type in resource_type_mapping.keys():
-                props = extract_resource_properties(workflow.goal_state, resource_type)
-                for prop_name, types in props.items():
-                    found_resources[resource_type][prop_name].update(types)
-
-        # Analyze expected_state_change in steps
-        if workflow.steps:
-            for step in workflow.steps:
-                if step.expected_state_change:
-                    for resource_type in resource_type_mapping.keys():
-                        props = extract_resource_properties(
-                            step.expected_state_change, resource_type
-                        )
-                        for prop_name, types in props.items():
-                            found_resources[resource_type][prop_name].update(types)
-
-        # Check for new resource types not in mapping
-        all_state_dicts = []
-        if workflow.initial_state:
-            all_state_dicts.append(workflow.initial_state)
-        if workflow.goal_state:
-            all_state_dicts.append(workflow.goal_state)
-        for step in workflow.steps:
-            if step.expected_state_change:
-                all_state_dicts.append(step.expected_state_change)
-
-        for state_dict in all_state_dicts:
-            for key in state_dict.keys():
-                if key not in resource_type_mapping and key != "active_catalog":
-                    # This is a potentially new resource type
-                    found_resources[key] = defaultdict(set)
-                    props = extract_resource_properties(state_dict, key)
-                    for prop_name, types in props.items():
-                        found_resources[key][prop_name].update(types)
-
-    # Convert sets to lists for JSON serialization
-    result = {}
-    for resource_type, properties in found_resources.items():
-        result[resource_type] = {
-            prop_name: sorted(list(types)) for prop_name, types in properties.items()
-        }
+    # Reshape into nested dicts, converting sets to lists for JSON serialization
+    result = {resource_type: {} for resource_type in found_types}
+    for (resource_type, prop_name), types in property_types.items():
+        result[resource_type][prop_name] = sorted(types)
 
     return result
 
 
 def compare_with_schema(found_resources: Dict) -> Dict:
     """Compare found resources with current schema."""
-    resource_type_mapping = {
-        "catalogs": Catalog,
-        "schemas": Schema,
-        "tables": Table,
-        "notebooks": Notebook,
-        "clusters": Cluster,
-        "jobs": Job,
-        "permissions": Permission,
-    }
 
     comparison = {
         "missing_resource_types": [],
@@ -177,13 +195,13 @@ def compare_with_schema(found_resources: Dict) -> Dict:
     # Check for missing resource types
     for resource_type in found_resources.keys():
         if (
-            resource_type not in resource_type_mapping
+            resource_type not in RESOURCE_TYPE_MAPPING
             and resource_type != "active_catalog"
         ):
             comparison["missing_resource_types"].append(resource_type)
 
     # Check for missing/mismatched properties
-    for resource_type, model_class in resource_type_mapping.items():
+    for resource_type, model_class in RESOURCE_TYPE_MAPPING.items():
         if resource_type not in found_resources:
             continue
 
@@ -255,114 +273,112 @@ def types_compatible(current: str, found: str) -> bool:
     return True
 
 
-def generate_markdown_report(analysis: Dict, comparison: Dict) -> str:
-    """Generate markdown report with recommendations."""
-    lines = []
-    lines.append("# State Schema Analysis Report\n")
-    lines.append(
-        f"Based on analysis of {analysis.get('workflow_count', 0)} workflow(s)\n\n"
+def iter_markdown_report(analysis: Dict, comparison: Dict) -> Iterator[str]:
+    """Yield the markdown report in chunks, in document order."""
+    workflow_count = analysis.get("workflow_count", 0)
+    found_resources = analysis.get("found_resources", {})
+    missing_resource_types = comparison.get("missing_resource_types", [])
+    new_properties = comparison.get("new_properties", {})
+    type_mismatches = comparison.get("type_mismatches", {})
+
+    total_missing_props = sum(len(props) for props in new_properties.values())
+    yield (
+        "# State Schema Analysis Report\n"
+        f"Based on analysis of {workflow_count} workflow(s)\n\n"
+        "## Summary\n\n"
+        f"- **Workflows analyzed**: {workflow_count}\n"
+        f"- **Resource types found**: {len(found_resources)}\n"
+        f"- **Missing resource types**: {len(missing_resource_types)}\n"
+        f"- **Missing properties**: {total_missing_props}\n\n"
     )
 
-    # Summary
-    lines.append("## Summary\n\n")
-    lines.append(f"- **Workflows analyzed**: {analysis.get('workflow_count', 0)}\n")
-    lines.append(
-        f"- **Resource types found**: {len(analysis.get('found_resources', {}))}\n"
-    )
-    lines.append(
-        f"- **Missing resource types**: {len(comparison.get('missing_resource_types', []))}\n"
-    )
-
-    total_missing_props = sum(
-        len(props) for props in comparison.get("new_properties", {}).values()
-    )
-    lines.append(f"- **Missing properties**: {total_missing_props}\n\n")
-
     # Missing resource types
-    if comparison.get("missing_resource_types"):
-        lines.append("## Missing Resource Types\n\n")
-        lines.append(
+    if missing_resource_types:
+        yield (
+            "## Missing Resource Types\n\n"
             "The following resource types were found in workflows but are not defined in state.py:\n\n"
         )
-        for resource_type in comparison["missing_resource_types"]:
+        for resource_type in missing_resource_types:
             props = analysis["found_resources"].get(resource_type, {})
-            lines.append(f"### {resource_type.title()}\n\n")
+            yield f"### {resource_type.title()}\n\n"
             if props:
-                lines.append("Properties found:\n")
-                for prop_name, types in props.items():
-                    types_str = ", ".join(types)
-                    lines.append(f"- `{prop_name}`: {types_str}\n")
-                lines.append("\n")
+                yield "Properties found:\n"
+                yield "".join(
+                    f"- `{prop_name}`: {', '.join(types)}\n"
+                    for prop_name, types in props.items()
+                )
+                yield "\n"
             else:
-                lines.append("No properties found.\n\n")
+                yield "No properties found.\n\n"
 
     # Missing properties
-    if comparison.get("new_properties"):
-        lines.append("## Missing Properties\n\n")
-        lines.append(
+    if new_properties:
+        yield (
+            "## Missing Properties\n\n"
             "The following properties are used in workflows but missing from current schema:\n\n"
         )
-        for resource_type, props in comparison["new_properties"].items():
-            lines.append(f"### {resource_type.title()}\n\n")
-            for prop in props:
-                prop_name = prop["name"]
-                types = prop["types"]
-                types_str = " | ".join(types)
-                lines.append(f"- `{prop_name}`: {types_str}\n")
-            lines.append("\n")
+        for resource_type, props in new_properties.items():
+            yield f"### {resource_type.title()}\n\n"
+            yield "".join(
+                f"- `{prop['name']}`: {' | '.join(prop['types'])}\n" for prop in props
+            )
+            yield "\n"
 
     # Type mismatches
-    if comparison.get("type_mismatches"):
-        lines.append("## Type Mismatches\n\n")
-        lines.append(
+    if type_mismatches:
+        yield (
+            "## Type Mismatches\n\n"
             "The following properties have type mismatches between schema and workflows:\n\n"
         )
-        for resource_type, mismatches in comparison["type_mismatches"].items():
-            lines.append(f"### {resource_type.title()}\n\n")
-            for mismatch in mismatches:
-                lines.append(
-                    f"- `{mismatch['property']}`: Schema has `{mismatch['current']}`, workflows use `{mismatch['found']}`\n"
-                )
-            lines.append("\n")
+        for resource_type, mismatches in type_mismatches.items():
+            yield f"### {resource_type.title()}\n\n"
+            yield "".join(
+                f"- `{mismatch['property']}`: Schema has `{mismatch['current']}`, workflows use `{mismatch['found']}`\n"
+                for mismatch in mismatches
+            )
+            yield "\n"
 
     # Recommendations
-    lines.append("## Recommendations\n\n")
+    yield "## Recommendations\n\n"
 
-    if comparison.get("missing_resource_types"):
-        lines.append("### Add New Resource Types\n\n")
-        for resource_type in comparison["missing_resource_types"]:
+    if missing_resource_types:
+        yield "### Add New Resource Types\n\n"
+        for resource_type in missing_resource_types:
             props = analysis["found_resources"].get(resource_type, {})
-            lines.append(f"Add `{resource_type.title()}` class:\n\n")
-            lines.append("```python\n")
-            lines.append(f"class {resource_type.title()}(BaseModel):\n")
-            lines.append(f'    """{resource_type.title()} resource."""\n\n')
+            title = resource_type.title()
+            yield (
+                f"Add `{title}` class:\n\n"
+                "```python\n"
+                f"class {title}(BaseModel):\n"
+                f'    """{title} resource."""\n\n'
+            )
             if props:
                 for prop_name, types in props.items():
                     type_str = types[0] if types else "Any"
                     # Convert to proper Python type
                     if "Optional" not in type_str and "List" not in type_str:
                         type_str = f"Optional[{type_str}]"
-                    lines.append(f"    {prop_name}: {type_str} = None\n")
+                    yield f"    {prop_name}: {type_str} = None\n"
             else:
-                lines.append("    # Properties to be determined\n")
-                lines.append("    pass\n")
-            lines.append('\n    model_config = {"frozen": True}\n')
-            lines.append("```\n\n")
-
-    if comparison.get("new_properties"):
-        lines.append("### Add Missing Properties\n\n")
-        for resource_type, props in comparison["new_properties"].items():
-            lines.append(f"Add to `{resource_type.title()}` class:\n\n")
+                yield "    # Properties to be determined\n    pass\n"
+            yield '\n    model_config = {"frozen": True}\n```\n\n'
+
+    if new_properties:
+        yield "### Add Missing Properties\n\n"
+        for resource_type, props in new_properties.items():
+            yield f"Add to `{resource_type.title()}` class:\n\n"
             for prop in props:
-                prop_name = prop["name"]
                 types = prop["types"]
                 type_str = types[0] if types else "Any"
                 if "Optional" not in type_str:
                     type_str = f"Optional[{type_str}]"
-                lines.append(f"    {prop_name}: {type_str} = None\n")
-            lines.append("\n")
+                yield f"    {prop['name']}: {type_str} = None\n"
+            yield "\n"
 
-    return "".join(lines)
+
+def generate_markdown_report(analysis: Dict, comparison: Dict) -> str:
+    """Generate markdown report with recommendations."""
+    return "".join(iter_markdown_report(analysis, comparison))
 
 
 def update_state_py(state_file: Path, comparison: Dict, found_resources: Dict) -> None:
@@ -409,6 +425,12 @@ def main():
         default="state_schema_recommendations.md",
         help="Output file for markdown recommendations (default: state_schema_recommendations.md)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes used to load workflow files (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -419,7 +441,7 @@ def main():
         sys.exit(1)
 
     print(f"Loading workflows from {workflows_dir}...")
-    workflows = load_all_workflows(str(workflows_dir))
+    workflows = load_workflows_parallel(workflows_dir, args.jobs)
 
     if not workflows:
         print("No workflows found. Please process tutorials first.")
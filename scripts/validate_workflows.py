@@ -2,8 +2,12 @@
 """Validate workflow YAML files."""
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -12,16 +16,23 @@ from saas_bench.utils.yaml_loader import load_all_workflows, load_workflow
 
 
 def validate_workflow(
-    workflow_path: str, validate_states: bool = True
+    workflow_path: str | Path,
+    validate_states: bool = True,
+    validation_cache: Optional[str] = None,
 ) -> tuple[bool, str]:
     """Validate a single workflow file.
 
     Args:
         workflow_path: Path to workflow YAML file
         validate_states: If True, validate initial_state and goal_state against DatabricksState schema
+        validation_cache: Directory of markers for files whose states already passed validation
     """
     try:
-        workflow = load_workflow(workflow_path, validate_states=validate_states)
+        workflow = load_workflow(
+            workflow_path,
+            validate_states=validate_states,
+            validation_cache=validation_cache,
+        )
         state_info = " (including state validation)" if validate_states else ""
         return True, f"✓ Valid: {workflow.title}{state_info}"
     except Exception as e:
@@ -46,6 +57,17 @@ def main():
         action="store_true",
         help="Skip validation of initial_state and goal_state against DatabricksState schema",
     )
+    parser.add_argument(
+        "--validation-cache",
+        metavar="DIR",
+        help="Skip state validation for files already validated unchanged (markers kept in DIR)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes used to validate workflows (default: CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -58,7 +80,7 @@ def main():
         if not workflow_dir.exists():
             print(f"Directory not found: {args.directory}")
             sys.exit(1)
-        workflows_to_validate = [str(f) for f in workflow_dir.glob("*.yaml")]
+        workflows_to_validate = list(workflow_dir.glob("*.yaml"))
 
     if not workflows_to_validate:
         print("No workflows found to validate")
@@ -69,10 +91,22 @@ def main():
     valid_count = 0
     invalid_count = 0
 
-    for workflow_path in workflows_to_validate:
-        is_valid, message = validate_workflow(
-            workflow_path, validate_states=not args.skip_state_validation
-        )
+    validate = partial(
+        validate_workflow,
+        validate_states=not args.skip_state_validation,
+        validation_cache=args.validation_cache,
+    )
+    workers = min(args.jobs, len(workflows_to_validate))
+    if workers <= 1:
+        results = map(validate, workflows_to_validate)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(validate, workflows_to_validate, chunksize=8)
+            )
+
+    # Results come back in input order, so output matches a serial run
+    for workflow_path, (is_valid, message) in zip(workflows_to_validate, results):
         print(f"{workflow_path}: {message}")
         if is_valid:
             valid_count += 1
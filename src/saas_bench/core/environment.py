@@ -1,46 +1,148 @@
 """Environment class for orchestrating agent-user-API interaction."""
 
-from typing import Dict, List
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, List, TypeVar, Union
 
-from ..domains.databricks.registry import TOOL_REGISTRY, get_all_tool_specs
-from ..domains.databricks.state import DatabricksState
+from ..domains.databricks.registry import (
+    TOOL_REGISTRY,
+    get_all_tool_specs,
+    validate_tool_args,
+)
+from ..domains.databricks.state import DatabricksState, tool_call_clock
+
+T = TypeVar("T")
+
+# Most recent states kept when snapshot recording is enabled
+SNAPSHOT_LIMIT = 32
+
+
+@dataclass(slots=True, frozen=True)
+class ToolCall:
+    """A tool invocation recorded in conversation history."""
+
+    type: ClassVar[str] = "tool_call"
+
+    tool: str
+    args: Dict
+    response: Dict
+
+    def to_dict(self) -> Dict:
+        """Return the history entry as a plain dict."""
+        return {
+            "type": self.type,
+            "tool": self.tool,
+            "args": self.args,
+            "response": self.response,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class UserMessage:
+    """A user message recorded in conversation history."""
+
+    type: ClassVar[str] = "user_message"
+
+    content: str
+
+    def to_dict(self) -> Dict:
+        """Return the history entry as a plain dict."""
+        return {"type": self.type, "content": self.content}
+
+
+@dataclass(slots=True, frozen=True)
+class AgentMessage:
+    """An agent message recorded in conversation history."""
+
+    type: ClassVar[str] = "agent_message"
+
+    content: str
+
+    def to_dict(self) -> Dict:
+        """Return the history entry as a plain dict."""
+        return {"type": self.type, "content": self.content}
+
+
+HistoryEntry = Union[ToolCall, UserMessage, AgentMessage]
+
+
+class _SequenceView(Sequence[T]):
+    """Read-only view over a list or deque, so getters don't copy on every call."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Sequence[T]):
+        self._items = items
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # Deques can't be sliced; a tuple also keeps the slice read-only
+            return tuple(self._items)[index]
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._items!r})"
 
 
 class Environment:
     """Orchestrates state transitions and tool execution."""
 
-    def __init__(self, initial_state: DatabricksState | None = None):
-        """Initialize environment with optional initial state."""
-        self._state = initial_state or DatabricksState()
-        self._conversation_history: List[Dict] = []
-        self._state_snapshots: List[DatabricksState] = [self._state]
+    def __init__(
+        self,
+        initial_state: DatabricksState | None = None,
+        record_snapshots: bool = False,
+        validate_args: bool = False,
+    ):
+        """Initialize environment with optional initial state.
+
+        Args:
+            initial_state: State to start from (empty state if omitted)
+            record_snapshots: If True, keep the last SNAPSHOT_LIMIT states produced
+                by tool calls for debugging; otherwise only the initial state is kept
+            validate_args: If True, check tool arguments against the tool's
+                parameters schema before running it
+        """
+        self._record_snapshots = record_snapshots
+        self._validate_args = validate_args
+        self._state = initial_state or DatabricksState.empty()
+        self._conversation_history: List[HistoryEntry] = []
+        self._state_snapshots: deque[DatabricksState] = deque(
+            [self._state], maxlen=SNAPSHOT_LIMIT
+        )
 
     def execute_tool(self, tool_name: str, args: Dict) -> Dict:
         """Execute a tool and update state."""
-        if tool_name not in TOOL_REGISTRY:
+        # One hash lookup instead of a membership test plus a subscript
+        tool_func = TOOL_REGISTRY.get(tool_name)
+        if tool_func is None:
             return {"error": f"Unknown tool: {tool_name}"}
 
-        tool_func = TOOL_REGISTRY[tool_name]
+        if self._validate_args:
+            valid, error = validate_tool_args(tool_name, args)
+            if not valid:
+                return {"error": f"Invalid arguments: {error}"}
 
         # Execute tool function
         try:
-            new_state, response = tool_func(self._state, args)
+            with tool_call_clock():
+                new_state, response = tool_func(self._state, args)
         except Exception as e:
             return {"error": f"Tool execution failed: {str(e)}"}
 
         # Update state immutably
         self._state = new_state
-        self._state_snapshots.append(new_state)
+        if self._record_snapshots:
+            self._state_snapshots.append(new_state)
 
         # Record in conversation history
-        self._conversation_history.append(
-            {
-                "type": "tool_call",
-                "tool": tool_name,
-                "args": args,
-                "response": response,
-            }
-        )
+        self._conversation_history.append(ToolCall(tool_name, args, response))
 
         return response
 
@@ -50,27 +152,31 @@ class Environment:
 
     def reset(self, initial_state: DatabricksState | None = None):
         """Reset environment to initial state."""
-        self._state = initial_state or DatabricksState()
+        self._state = initial_state or DatabricksState.empty()
         self._conversation_history = []
-        self._state_snapshots = [self._state]
+        self._state_snapshots = deque([self._state], maxlen=SNAPSHOT_LIMIT)
 
-    def get_tool_specs(self) -> List[Dict]:
-        """Get specifications for all available tools."""
+    def get_tool_specs(self) -> Sequence[Dict[str, Any]]:
+        """Get specifications for all available tools (shared; treat as read-only)."""
         return get_all_tool_specs()
 
-    def get_conversation_history(self) -> List[Dict]:
-        """Get conversation history."""
+    def get_conversation_history(self) -> Sequence[HistoryEntry]:
+        """Get a live, read-only view of the conversation history."""
+        return _SequenceView(self._conversation_history)
+
+    def copy_conversation_history(self) -> List[HistoryEntry]:
+        """Get a mutable copy of the conversation history."""
         return self._conversation_history.copy()
 
-    def get_state_snapshots(self) -> List[DatabricksState]:
-        """Get state snapshots for debugging."""
-        return self._state_snapshots.copy()
+    def get_state_snapshots(self) -> Sequence[DatabricksState]:
+        """Get a live, read-only view of state snapshots for debugging."""
+        return _SequenceView(self._state_snapshots)
 
     def add_user_message(self, message: str):
         """Add a user message to conversation history."""
-        self._conversation_history.append({"type": "user_message", "content": message})
+        self._conversation_history.append(UserMessage(message))
 
     def add_agent_message(self, message: str):
         """Add an agent message to conversation history."""
-        self._conversation_history.append({"type": "agent_message", "content": message})
+        self._conversation_history.append(AgentMessage(message))
 
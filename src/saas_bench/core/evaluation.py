@@ -1,10 +1,38 @@
 """Evaluation logic for comparing final state to goal state."""
 
-from typing import Dict, List
+from collections.abc import KeysView
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, List, Literal, Tuple, Union
 
 from pydantic import BaseModel
 
-from ..domains.databricks.state import DatabricksState
+from ..domains.databricks.state import Column, DatabricksState, Table
+
+
+@dataclass(slots=True)
+class Differences:
+    """Everything evaluate_task found missing or wrong in a final state.
+
+    Filled in by attribute while evaluating; EvaluationResult holds it as a
+    plain dict (see to_dict).
+    """
+
+    missing_catalogs: List[str] = field(default_factory=list)
+    missing_schemas: List[str] = field(default_factory=list)
+    missing_tables: List[str] = field(default_factory=list)
+    missing_notebooks: List[str] = field(default_factory=list)
+    # Display strings, or raw (principal, privilege, securable_name) tuples in
+    # the early-exit modes
+    missing_permissions: List[Any] = field(default_factory=list)
+    incorrect_tables: List[Dict] = field(default_factory=list)
+    extra_resources: Dict[str, List[str]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the differences as a dict keyed by field name."""
+        return {name: getattr(self, name) for name in _DIFFERENCE_FIELDS}
+
+
+_DIFFERENCE_FIELDS = tuple(f.name for f in fields(Differences))
 
 
 class EvaluationResult(BaseModel):
@@ -19,125 +47,294 @@ class EvaluationResult(BaseModel):
     model_config = {"frozen": True}
 
 
-def evaluate_task(
-    final_state: DatabricksState, goal_state: DatabricksState
-) -> EvaluationResult:
-    """Compare final state to goal state and determine success."""
-    differences: Dict = {
-        "missing_catalogs": [],
-        "missing_schemas": [],
-        "missing_tables": [],
-        "missing_notebooks": [],
-        "missing_permissions": [],
-        "incorrect_tables": [],
-        "extra_resources": {},
-    }
-    milestones_achieved: List[str] = []
-    minefields_triggered: List[str] = []
+class GoalPlan:
+    """Goal-state lookups evaluate_task needs, built once per goal state.
 
-    # Check catalogs
-    for catalog_name, goal_catalog in goal_state.catalogs.items():
-        if catalog_name not in final_state.catalogs:
-            differences["missing_catalogs"].append(catalog_name)
-        else:
-            milestones_achieved.append(f"Catalog '{catalog_name}' exists")
+    Build one with GoalPlan.from_state and pass it to evaluate_task in place
+    of the goal state when evaluating many final states against one goal.
+    """
 
-    # Check schemas
-    for schema_key, goal_schema in goal_state.schemas.items():
-        if schema_key not in final_state.schemas:
-            differences["missing_schemas"].append(schema_key)
-        else:
-            milestones_achieved.append(f"Schema '{schema_key}' exists")
+    __slots__ = (
+        "catalog_keys",
+        "schema_keys",
+        "notebook_keys",
+        "tables",
+        "column_maps",
+        "permissions",
+        "total_checks",
+    )
 
-    # Check tables
-    for table_key, goal_table in goal_state.tables.items():
-        if table_key not in final_state.tables:
-            differences["missing_tables"].append(table_key)
+    def __init__(
+        self,
+        catalog_keys: KeysView[str],
+        schema_keys: KeysView[str],
+        notebook_keys: KeysView[str],
+        tables: Dict[str, Table],
+        column_maps: Dict[str, Dict[str, Column]],
+        permissions: FrozenSet[Tuple[str, str, str]],
+        total_checks: int,
+    ):
+        self.catalog_keys = catalog_keys
+        self.schema_keys = schema_keys
+        self.notebook_keys = notebook_keys
+        self.tables = tables
+        self.column_maps = column_maps
+        self.permissions = permissions
+        self.total_checks = total_checks
+
+    @classmethod
+    def from_state(cls, goal_state: DatabricksState) -> "GoalPlan":
+        """Precompute the evaluation plan for a goal state."""
+        return cls(
+            catalog_keys=goal_state.catalogs.keys(),
+            schema_keys=goal_state.schemas.keys(),
+            notebook_keys=goal_state.notebooks.keys(),
+            tables=goal_state.tables,
+            # Filled on demand; only needed when column lists differ
+            column_maps={},
+            permissions=goal_state.permission_keys,
+            total_checks=goal_state.total_checks,
+        )
+
+
+def _check_present(
+    goal_keys: KeysView[str],
+    final_resources: Dict[str, Any],
+    milestone: str,
+    missing: List[str],
+    milestones_achieved: List[str],
+) -> int:
+    """Record which goal keys final_resources lacks; return how many it has.
+
+    Present keys add milestone.format(key) to milestones_achieved, absent ones
+    are appended to missing, both in goal order. When nothing is missing (the
+    common case) a single C-level subset test on the key views replaces the
+    per-key membership checks.
+    """
+    if goal_keys <= final_resources.keys():
+        milestones_achieved.extend([milestone.format(key) for key in goal_keys])
+        return len(goal_keys)
+
+    present = 0
+    for key in goal_keys:
+        if key not in final_resources:
+            missing.append(key)
         else:
-            final_table = final_state.tables[table_key]
-            # Check table schema (columns)
-            goal_columns = {col.name: col for col in goal_table.columns}
+            milestones_achieved.append(milestone.format(key))
+            present += 1
+    return present
+
+
+def _check_tables(
+    goal: GoalPlan,
+    final_tables: Dict[str, Table],
+    missing_tables: List[str],
+    incorrect_tables: List[Dict],
+    milestones_achieved: List[str],
+) -> int:
+    """Compare each goal table's columns and data; return how many schemas match.
+
+    Absent tables go to missing_tables, and column or row-count problems to
+    incorrect_tables, in goal order.
+    """
+    passed = 0
+    column_maps = goal.column_maps
+    for table_key, goal_table in goal.tables.items():
+        final_table = final_tables.get(table_key)
+        if final_table is None:
+            missing_tables.append(table_key)
+            continue
+
+        # Check table schema (columns); an untouched table shared with the goal
+        # needs no comparison, and identical column tuples are the common case,
+        # otherwise compare by name so column order doesn't matter
+        columns_match = (
+            final_table is goal_table or goal_table.columns == final_table.columns
+        )
+        if not columns_match:
+            goal_columns = column_maps.get(table_key)
+            if goal_columns is None:
+                goal_columns = column_maps[table_key] = {
+                    col.name: col for col in goal_table.columns
+                }
             final_columns = {col.name: col for col in final_table.columns}
+            columns_match = goal_columns == final_columns
 
-            if goal_columns != final_columns:
-                differences["incorrect_tables"].append(
+        if not columns_match:
+            incorrect_tables.append(
+                {
+                    "table": table_key,
+                    "issue": "Column schema mismatch",
+                    "expected": dict(zip(*goal_table.columns_soa)),
+                    "actual": dict(zip(*final_table.columns_soa)),
+                }
+            )
+        else:
+            milestones_achieved.append(
+                f"Table '{table_key}' created with correct schema"
+            )
+            passed += 1
+
+        # Check table data (if goal state specifies data)
+        if goal_table.data:
+            if len(final_table.data) < len(goal_table.data):
+                incorrect_tables.append(
                     {
                         "table": table_key,
-                        "issue": "Column schema mismatch",
-                        "expected": {name: col.type for name, col in goal_columns.items()},
-                        "actual": {name: col.type for name, col in final_columns.items()},
+                        "issue": "Insufficient data rows",
+                        "expected_rows": len(goal_table.data),
+                        "actual_rows": len(final_table.data),
                     }
                 )
             else:
-                milestones_achieved.append(f"Table '{table_key}' created with correct schema")
-
-            # Check table data (if goal state specifies data)
-            if goal_table.data:
-                if len(final_table.data) < len(goal_table.data):
-                    differences["incorrect_tables"].append(
-                        {
-                            "table": table_key,
-                            "issue": "Insufficient data rows",
-                            "expected_rows": len(goal_table.data),
-                            "actual_rows": len(final_table.data),
-                        }
-                    )
-                else:
-                    milestones_achieved.append(f"Table '{table_key}' has data inserted")
+                milestones_achieved.append(f"Table '{table_key}' has data inserted")
+    return passed
+
+
+def _early_failure(
+    milestones_achieved: List[str],
+    minefields_triggered: List[str],
+    differences: Differences,
+) -> EvaluationResult:
+    """Failed result for a mode that stopped before checking everything."""
+    return EvaluationResult.model_construct(
+        success=False,
+        score=0.0,
+        milestones_achieved=milestones_achieved,
+        minefields_triggered=minefields_triggered,
+        differences=differences.to_dict(),
+    )
+
+
+def evaluate_task(
+    final_state: DatabricksState,
+    goal_state: Union[DatabricksState, GoalPlan],
+    mode: Literal["full", "fast", "first_diff"] = "full",
+) -> EvaluationResult:
+    """Compare final state to goal state and determine success.
+
+    Args:
+        final_state: State reached by the agent
+        goal_state: State the task expects, or a GoalPlan built from it
+        mode: "full" computes every difference. "fast" returns as soon as a
+            goal catalog or schema is missing, with score 0.0 and only the
+            differences found so far, and reports missing permissions as raw
+            (principal, privilege, securable_name) tuples.
+            "first_diff" is like "fast" but stops after the first category
+            (catalogs, schemas, tables, notebooks, permissions) with any
+            difference, for callers that only need to know whether the task
+            failed.
+    """
+    goal = (
+        goal_state
+        if isinstance(goal_state, GoalPlan)
+        else GoalPlan.from_state(goal_state)
+    )
+
+    differences = Differences()
+    milestones_achieved: List[str] = []
+    minefields_triggered: List[str] = []
+    # Only checks counted in total_checks contribute to the score
+    passed_checks = 0
+
+    final_catalogs = final_state.catalogs
+    final_tables = final_state.tables
+
+    # Check catalogs
+    missing_catalogs = differences.missing_catalogs
+    passed_checks += _check_present(
+        goal.catalog_keys,
+        final_catalogs,
+        "Catalog '{}' exists",
+        missing_catalogs,
+        milestones_achieved,
+    )
+
+    stop_on_first = mode == "first_diff"
+    if stop_on_first and missing_catalogs:
+        return _early_failure(milestones_achieved, minefields_triggered, differences)
+
+    # Check schemas
+    missing_schemas = differences.missing_schemas
+    passed_checks += _check_present(
+        goal.schema_keys,
+        final_state.schemas,
+        "Schema '{}' exists",
+        missing_schemas,
+        milestones_achieved,
+    )
+
+    if mode != "full" and (missing_catalogs or missing_schemas):
+        return _early_failure(milestones_achieved, minefields_triggered, differences)
+
+    # Check tables
+    incorrect_tables = differences.incorrect_tables
+    passed_checks += _check_tables(
+        goal,
+        final_tables,
+        differences.missing_tables,
+        incorrect_tables,
+        milestones_achieved,
+    )
+
+    if stop_on_first and (differences.missing_tables or incorrect_tables):
+        return _early_failure(milestones_achieved, minefields_triggered, differences)
 
     # Check notebooks
-    for notebook_path, goal_notebook in goal_state.notebooks.items():
-        if notebook_path not in final_state.notebooks:
-            differences["missing_notebooks"].append(notebook_path)
-        else:
-            milestones_achieved.append(f"Notebook '{notebook_path}' created")
+    missing_notebooks = differences.missing_notebooks
+    passed_checks += _check_present(
+        goal.notebook_keys,
+        final_state.notebooks,
+        "Notebook '{}' created",
+        missing_notebooks,
+        milestones_achieved,
+    )
+
+    if stop_on_first and missing_notebooks:
+        return _early_failure(milestones_achieved, minefields_triggered, differences)
 
     # Check permissions
-    goal_permissions = {
-        (p.principal, p.privilege, p.securable_name) for p in goal_state.permissions
-    }
-    final_permissions = {
-        (p.principal, p.privilege, p.securable_name) for p in final_state.permissions
-    }
+    goal_permissions = goal.permissions
+    final_permissions = final_state.permission_keys
 
     missing_perms = goal_permissions - final_permissions
+    passed_checks += len(goal_permissions) - len(missing_perms)
     if missing_perms:
-        differences["missing_permissions"] = [
-            f"{principal} - {privilege} on {securable}" for principal, privilege, securable in missing_perms
-        ]
+        if mode != "full":
+            # Callers of the early-exit modes only need to know what is missing, so skip
+            # building a display string per permission
+            differences.missing_permissions = list(missing_perms)
+        else:
+            differences.missing_permissions = [
+                f"{principal} - {privilege} on {securable}" for principal, privilege, securable in missing_perms
+            ]
+        if stop_on_first:
+            return _early_failure(
+                milestones_achieved, minefields_triggered, differences
+            )
     else:
         milestones_achieved.append("All required permissions granted")
 
     # Check for extra resources (optional - may want to allow extras)
-    extra_catalogs = set(final_state.catalogs.keys()) - set(goal_state.catalogs.keys())
-    extra_tables = set(final_state.tables.keys()) - set(goal_state.tables.keys())
+    extra_catalogs = final_catalogs.keys() - goal.catalog_keys
+    extra_tables = final_tables.keys() - goal.tables.keys()
     if extra_catalogs or extra_tables:
-        differences["extra_resources"] = {
+        differences.extra_resources = {
             "catalogs": list(extra_catalogs),
             "tables": list(extra_tables),
         }
 
     # Calculate success
     has_missing_resources = (
-        differences["missing_catalogs"]
-        or differences["missing_schemas"]
-        or differences["missing_tables"]
-        or differences["missing_notebooks"]
+        missing_catalogs or missing_schemas or differences.missing_tables or missing_notebooks
     )
-    has_incorrect_tables = bool(differences["incorrect_tables"])
-    has_missing_permissions = bool(differences["missing_permissions"])
+    has_incorrect_tables = bool(incorrect_tables)
+    has_missing_permissions = bool(missing_perms)
 
     success = not (has_missing_resources or has_incorrect_tables or has_missing_permissions)
 
     # Calculate score (partial credit)
-    total_checks = (
-        len(goal_state.catalogs)
-        + len(goal_state.schemas)
-        + len(goal_state.tables)
-        + len(goal_state.notebooks)
-        + len(goal_state.permissions)
-    )
-    passed_checks = len(milestones_achieved)
+    total_checks = goal.total_checks
     score = passed_checks / total_checks if total_checks > 0 else 1.0
 
     # Check for minefields (critical violations)
@@ -145,14 +342,15 @@ def evaluate_task(
     extra_perms = final_permissions - goal_permissions
     if extra_perms:
         minefields_triggered.append(
-            f"Unexpected permissions granted: {extra_perms}"
+            f"Unexpected permissions granted: {set(extra_perms)}"
         )
 
-    return EvaluationResult(
+    # Every field is built here with the right type, so skip validation
+    return EvaluationResult.model_construct(
         success=success,
         score=score,
         milestones_achieved=milestones_achieved,
         minefields_triggered=minefields_triggered,
-        differences=differences,
+        differences=differences.to_dict(),
     )
 
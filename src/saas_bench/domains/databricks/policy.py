@@ -1,97 +1,15 @@
 """Policy document and validation for Databricks operations."""
 
-import re
-from typing import Dict
+import string
+from typing import Callable, Dict
 
 from .state import DatabricksState
 
+# Bytes allowed in resource names; deleting them from a valid name leaves nothing
+_NAME_CHARS = (string.ascii_letters + string.digits + "_").encode("ascii")
 
-class Policy:
-    """Policy validation for Databricks operations."""
-
-    MAX_CATALOG_NAME_LENGTH = 255
-    MAX_SCHEMA_NAME_LENGTH = 255
-    MAX_TABLE_NAME_LENGTH = 255
-    MAX_CLUSTERS_PER_WORKSPACE = 100
-
-    @staticmethod
-    def validate_catalog_name(name: str) -> tuple[bool, str]:
-        """Validate catalog name against naming conventions."""
-        if not name:
-            return False, "Catalog name cannot be empty"
-        if len(name) > Policy.MAX_CATALOG_NAME_LENGTH:
-            return False, f"Catalog name exceeds maximum length of {Policy.MAX_CATALOG_NAME_LENGTH}"
-        if not re.match(r"^[a-zA-Z0-9_]+$", name):
-            return False, "Catalog name must contain only alphanumeric characters and underscores"
-        return True, ""
-
-    @staticmethod
-    def validate_schema_name(name: str) -> tuple[bool, str]:
-        """Validate schema name against naming conventions."""
-        if not name:
-            return False, "Schema name cannot be empty"
-        if len(name) > Policy.MAX_SCHEMA_NAME_LENGTH:
-            return False, f"Schema name exceeds maximum length of {Policy.MAX_SCHEMA_NAME_LENGTH}"
-        if not re.match(r"^[a-zA-Z0-9_]+$", name):
-            return False, "Schema name must contain only alphanumeric characters and underscores"
-        return True, ""
-
-    @staticmethod
-    def validate_table_name(name: str) -> tuple[bool, str]:
-        """Validate table name against naming conventions."""
-        if not name:
-            return False, "Table name cannot be empty"
-        if len(name) > Policy.MAX_TABLE_NAME_LENGTH:
-            return False, f"Table name exceeds maximum length of {Policy.MAX_TABLE_NAME_LENGTH}"
-        if not re.match(r"^[a-zA-Z0-9_]+$", name):
-            return False, "Table name must contain only alphanumeric characters and underscores"
-        return True, ""
-
-    @staticmethod
-    def validate_cluster_count(state: DatabricksState) -> tuple[bool, str]:
-        """Validate that cluster count doesn't exceed limit."""
-        if len(state.clusters) >= Policy.MAX_CLUSTERS_PER_WORKSPACE:
-            return False, f"Maximum number of clusters ({Policy.MAX_CLUSTERS_PER_WORKSPACE}) exceeded"
-        return True, ""
-
-    @staticmethod
-    def validate_action(state: DatabricksState, action: Dict) -> tuple[bool, str]:
-        """Validate if an action violates policy."""
-        action_type = action.get("type")
-        args = action.get("args", {})
-
-        if action_type == "create_catalog":
-            catalog_name = args.get("catalog_name")
-            if catalog_name:
-                valid, msg = Policy.validate_catalog_name(catalog_name)
-                if not valid:
-                    return False, msg
-
-        elif action_type == "create_schema":
-            schema_name = args.get("schema_name")
-            if schema_name:
-                valid, msg = Policy.validate_schema_name(schema_name)
-                if not valid:
-                    return False, msg
-
-        elif action_type == "create_table":
-            table_name = args.get("table_name")
-            if table_name:
-                valid, msg = Policy.validate_table_name(table_name)
-                if not valid:
-                    return False, msg
-
-        elif action_type == "create_cluster":
-            valid, msg = Policy.validate_cluster_count(state)
-            if not valid:
-                return False, msg
-
-        return True, ""
-
-    @staticmethod
-    def get_policy_document() -> str:
-        """Return policy document text for agents."""
-        return """# Databricks Workspace Policy
+# Shared by every caller instead of re-evaluating the literal per call
+_POLICY_DOCUMENT = """# Databricks Workspace Policy
 
 ## Naming Conventions
 
@@ -164,3 +82,80 @@ class Policy:
 - Monitor job execution and failures
 """
 
+
+class Policy:
+    """Policy validation for Databricks operations."""
+
+    MAX_CATALOG_NAME_LENGTH = 255
+    MAX_SCHEMA_NAME_LENGTH = 255
+    MAX_TABLE_NAME_LENGTH = 255
+    MAX_CLUSTERS_PER_WORKSPACE = 100
+
+    @staticmethod
+    def _validate_name(name: str, kind: str, max_length: int) -> tuple[bool, str]:
+        """Validate a resource name against naming conventions."""
+        if not name:
+            return False, f"{kind} name cannot be empty"
+        if len(name) > max_length:
+            return False, f"{kind} name exceeds maximum length of {max_length}"
+        if not name.isascii() or name.encode("ascii").translate(None, _NAME_CHARS):
+            return False, f"{kind} name must contain only alphanumeric characters and underscores"
+        return True, ""
+
+    @staticmethod
+    def validate_catalog_name(name: str) -> tuple[bool, str]:
+        """Validate catalog name against naming conventions."""
+        return Policy._validate_name(name, "Catalog", Policy.MAX_CATALOG_NAME_LENGTH)
+
+    @staticmethod
+    def validate_schema_name(name: str) -> tuple[bool, str]:
+        """Validate schema name against naming conventions."""
+        return Policy._validate_name(name, "Schema", Policy.MAX_SCHEMA_NAME_LENGTH)
+
+    @staticmethod
+    def validate_table_name(name: str) -> tuple[bool, str]:
+        """Validate table name against naming conventions."""
+        return Policy._validate_name(name, "Table", Policy.MAX_TABLE_NAME_LENGTH)
+
+    @staticmethod
+    def validate_cluster_count(state: DatabricksState) -> tuple[bool, str]:
+        """Validate that cluster count doesn't exceed limit."""
+        if len(state.clusters) >= Policy.MAX_CLUSTERS_PER_WORKSPACE:
+            return False, f"Maximum number of clusters ({Policy.MAX_CLUSTERS_PER_WORKSPACE}) exceeded"
+        return True, ""
+
+    @staticmethod
+    def validate_action(state: DatabricksState, action: Dict) -> tuple[bool, str]:
+        """Validate if an action violates policy."""
+        validator = _ACTION_VALIDATORS.get(action.get("type"))
+        if validator is None:
+            return True, ""
+        return validator(state, action.get("args", {}))
+
+    @staticmethod
+    def get_policy_document() -> str:
+        """Return policy document text for agents."""
+        return _POLICY_DOCUMENT
+
+
+def _name_validator(
+    arg_name: str, validate: Callable[[str], tuple[bool, str]]
+) -> Callable[[DatabricksState, Dict], tuple[bool, str]]:
+    """Build an action validator that checks one name argument, when given."""
+
+    def validate_args(state: DatabricksState, args: Dict) -> tuple[bool, str]:
+        name = args.get(arg_name)
+        if not name:
+            return True, ""
+        return validate(name)
+
+    return validate_args
+
+
+# Action type -> validator(state, args); action types not listed always pass
+_ACTION_VALIDATORS: Dict[str, Callable[[DatabricksState, Dict], tuple[bool, str]]] = {
+    "create_catalog": _name_validator("catalog_name", Policy.validate_catalog_name),
+    "create_schema": _name_validator("schema_name", Policy.validate_schema_name),
+    "create_table": _name_validator("table_name", Policy.validate_table_name),
+    "create_cluster": lambda state, args: Policy.validate_cluster_count(state),
+}
@@ -1,12 +1,56 @@
 """Databricks state schema using Pydantic models."""
 
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import cached_property, lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from pydantic import BaseModel, Field
 
+from ...utils.cached_views import CachedViewsModel
 
-class Column(BaseModel):
+
+# Timestamp shared by every resource created during one tool call
+_TOOL_CALL_TIME: ContextVar[Optional[datetime]] = ContextVar(
+    "_TOOL_CALL_TIME", default=None
+)
+
+
+def _now() -> datetime:
+    """Creation time for new resources: the current tool call's time, if set."""
+    return _TOOL_CALL_TIME.get() or datetime.now()
+
+
+@contextmanager
+def tool_call_clock() -> Iterator[datetime]:
+    """Read the clock once and stamp every resource created inside the block with it."""
+    now = datetime.now()
+    token = _TOOL_CALL_TIME.set(now)
+    try:
+        yield now
+    finally:
+        _TOOL_CALL_TIME.reset(token)
+
+
+# Column and Permission are plain slotted dataclasses: they are created in bulk
+# by the tools from already-checked arguments, and pydantic still validates them
+# when a DatabricksState is built from raw dicts (e.g. workflow YAML)
+@dataclass(slots=True, frozen=True)
+class Column:
     """Represents a table column."""
 
     name: str
@@ -14,7 +58,15 @@ class Column(BaseModel):
     nullable: bool = True
     comment: Optional[str] = None
 
-    model_config = {"frozen": True}
+    def __post_init__(self) -> None:
+        # Dataclasses don't check annotations; a bad field would only surface
+        # when the state is dumped and validated again
+        if not isinstance(self.name, str) or not isinstance(self.type, str):
+            raise TypeError("Column name and type must be strings")
+        if not isinstance(self.nullable, bool):
+            raise TypeError("Column nullable must be a boolean")
+        if self.comment is not None and not isinstance(self.comment, str):
+            raise TypeError("Column comment must be a string")
 
 
 class Catalog(BaseModel):
@@ -25,7 +77,7 @@ class Catalog(BaseModel):
     type: Optional[str] = None  # "standard", "shared", or "foreign"
     comment: Optional[str] = None
     properties: Dict[str, str] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
@@ -37,24 +89,52 @@ class Schema(BaseModel):
     schema_name: str
     owner: str
     comment: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
 
-class Table(BaseModel):
+def _rows_to_columns(rows: List[Dict]) -> Dict[str, Tuple[Any, ...]]:
+    """Transpose row dicts into per-column value tuples, in first-seen key order."""
+    names = dict.fromkeys(name for row in rows for name in row)
+    return {name: tuple(row.get(name) for row in rows) for name in names}
+
+
+class Table(CachedViewsModel):
     """Unity Catalog table."""
 
     catalog_name: str
     schema_name: str
     table_name: str
-    columns: List[Column]
+    # A tuple, so equal column sets compare in one C-level tuple comparison
+    columns: Tuple[Column, ...]
     data: List[Dict] = Field(default_factory=list)  # Table rows as dicts
     owner: str
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
+    @property
+    def key(self) -> str:
+        """Key of this table in DatabricksState.tables: "catalog.schema.table"."""
+        return _table_key(self.catalog_name, self.schema_name, self.table_name)
+
+    @cached_property
+    def columns_soa(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Column names and types as parallel tuples (computed once per table)."""
+        return (
+            tuple(col.name for col in self.columns),
+            tuple(col.type for col in self.columns),
+        )
+
+    @cached_property
+    def data_columns(self) -> Dict[str, Tuple[Any, ...]]:
+        """Row data as one tuple of values per column (computed once per table).
+
+        Rows missing a column contribute None, so every tuple has len(data) values.
+        """
+        return _rows_to_columns(self.data)
+
 
 class Notebook(BaseModel):
     """Databricks notebook."""
@@ -63,7 +143,7 @@ class Notebook(BaseModel):
     language: str  # "sql", "python", "scala", "r"
     cells: List[str] = Field(default_factory=list)
     attached_cluster_id: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
@@ -77,7 +157,7 @@ class Cluster(BaseModel):
     node_type: str
     num_workers: int
     spark_version: str
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
@@ -89,12 +169,13 @@ class Job(BaseModel):
     name: str
     schedule: Optional[str] = None  # Cron expression
     tasks: List[Dict] = Field(default_factory=list)
-    created_at: datetime = Field(default_factory=datetime.now)
+    created_at: datetime = Field(default_factory=_now)
 
     model_config = {"frozen": True}
 
 
-class Permission(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Permission:
     """Access control permission."""
 
     principal: str  # User or group name
@@ -102,10 +183,39 @@ class Permission(BaseModel):
     securable_type: str  # "TABLE", "CATALOG", "SCHEMA", etc.
     securable_name: str  # e.g., "catalog.schema.table"
 
-    model_config = {"frozen": True}
 
+# (principal, privilege, securable_name), read in C rather than per-attribute bytecode
+_permission_key = attrgetter("principal", "privilege", "securable_name")
+
+
+def _group_by(items: Iterable[Any], key: Callable[[Any], Any]) -> Dict[Any, Tuple]:
+    """Group items by key(item), keeping their original order within each group."""
+    grouped: Dict[Any, List] = {}
+    for item in items:
+        grouped.setdefault(key(item), []).append(item)
+    return {name: tuple(group) for name, group in grouped.items()}
+
+
+def _index_by_securable(
+    permissions: List[Permission],
+) -> Dict[str, Tuple[Permission, ...]]:
+    """Group permissions by securable_name, keeping grant order."""
+    return _group_by(permissions, attrgetter("securable_name"))
 
-class DatabricksState(BaseModel):
+
+# The same keys are rebuilt and looked up on every tool call, so cache them:
+# repeat calls skip the formatting and get back one interned string object
+@lru_cache(maxsize=4096)
+def _schema_key(catalog_name: str, schema_name: str) -> str:
+    return sys.intern(f"{catalog_name}.{schema_name}")
+
+
+@lru_cache(maxsize=4096)
+def _table_key(catalog_name: str, schema_name: str, table_name: str) -> str:
+    return sys.intern(f"{catalog_name}.{schema_name}.{table_name}")
+
+
+class DatabricksState(CachedViewsModel):
     """Root state container for Databricks workspace."""
 
     catalogs: Dict[str, Catalog] = Field(default_factory=dict)
@@ -119,14 +229,70 @@ class DatabricksState(BaseModel):
     permissions: List[Permission] = Field(default_factory=list)
     active_catalog: Optional[str] = None  # Current catalog context
 
-    model_config = {"frozen": True}
+    # Nested models passed in by the tools are already validated, and state is
+    # rebuilt on every tool call, so never re-validate them ("never" is the
+    # pydantic default; pinned here because the tools rely on it)
+    model_config = {"frozen": True, "revalidate_instances": "never"}
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def empty(cls) -> "DatabricksState":
+        """Shared empty state, built once; like every state, never mutate its dicts."""
+        return cls()
+
+    @classmethod
+    def with_tables(cls, *tables: Table) -> "DatabricksState":
+        """State holding just the given tables, each under its Table.key."""
+        return cls(tables={table.key: table for table in tables})
+
+    @cached_property
+    def permission_keys(self) -> FrozenSet[Tuple[str, str, str]]:
+        """(principal, privilege, securable_name) for every permission, computed once."""
+        return frozenset(map(_permission_key, self.permissions))
+
+    @cached_property
+    def _permissions_by_securable(self) -> Dict[str, Tuple[Permission, ...]]:
+        return _index_by_securable(self.permissions)
+
+    @cached_property
+    def _schemas_by_catalog(self) -> Dict[str, Tuple[Schema, ...]]:
+        return _group_by(self.schemas.values(), attrgetter("catalog_name"))
+
+    @cached_property
+    def _tables_by_schema(self) -> Dict[Tuple[str, str], Tuple[Table, ...]]:
+        return _group_by(
+            self.tables.values(), attrgetter("catalog_name", "schema_name")
+        )
+
+    def permissions_for(self, securable_name: str) -> Tuple[Permission, ...]:
+        """Permissions granted on one securable, via an index built once per state."""
+        return self._permissions_by_securable.get(securable_name, ())
+
+    def schemas_in(self, catalog_name: str) -> Tuple[Schema, ...]:
+        """Schemas of one catalog, via an index built once per state."""
+        return self._schemas_by_catalog.get(catalog_name, ())
+
+    def tables_in(self, catalog_name: str, schema_name: str) -> Tuple[Table, ...]:
+        """Tables of one catalog.schema, via an index built once per state."""
+        return self._tables_by_schema.get((catalog_name, schema_name), ())
+
+    @property
+    def total_checks(self) -> int:
+        """Number of goal checks this state implies when used as an evaluation goal."""
+        return (
+            len(self.catalogs)
+            + len(self.schemas)
+            + len(self.tables)
+            + len(self.notebooks)
+            + len(self.permission_keys)
+        )
 
     def get_schema_key(self, catalog_name: str, schema_name: str) -> str:
         """Get the key for a schema in the schemas dict."""
-        return f"{catalog_name}.{schema_name}"
+        return _schema_key(catalog_name, schema_name)
 
     def get_table_key(
         self, catalog_name: str, schema_name: str, table_name: str
     ) -> str:
         """Get the key for a table in the tables dict."""
-        return f"{catalog_name}.{schema_name}.{table_name}"
+        return _table_key(catalog_name, schema_name, table_name)
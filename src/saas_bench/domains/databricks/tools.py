@@ -1,10 +1,12 @@
 """Databricks API tools as pure functions."""
 
-from typing import Dict, Tuple
+import uuid
+from typing import Callable, Dict, Tuple
 
 from .state import (
     Catalog,
     Cluster,
+    Column,
     DatabricksState,
     Job,
     Notebook,
@@ -14,6 +16,50 @@ from .state import (
 )
 
 
+def tool_spec(description: str, parameters: Dict) -> Callable:
+    """Attach a tool's spec (name, description, parameters schema) to its function."""
+
+    def decorate(fn: Callable) -> Callable:
+        fn.spec = {
+            "name": fn.__name__,
+            "description": description,
+            "parameters": parameters,
+        }
+        return fn
+
+    return decorate
+
+
+# Parameter schemas shared by several tools; every spec refers to the same
+# dict, so treat these as read-only
+_CATALOG_NAME_PROP = {"type": "string", "description": "Name of the catalog"}
+_SCHEMA_NAME_PROP = {"type": "string", "description": "Name of the schema"}
+_TABLE_NAME_PROP = {"type": "string", "description": "Name of the table"}
+_PRINCIPAL_PROP = {"type": "string", "description": "User or group name"}
+_NOTEBOOK_PATH_PROP = {"type": "string", "description": "Path to the notebook"}
+
+
+def _set_entry(
+    state: DatabricksState, field: str, key: str, value: object
+) -> DatabricksState:
+    """Return a copy of state with one entry of a dict-valued field set.
+
+    All keyed state updates go through here, so the collection type can
+    change without touching each tool.
+    """
+    return state.model_copy(update={field: {**getattr(state, field), key: value}})
+
+
+@tool_spec(
+    description="Set the active catalog context",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": {"type": "string", "description": "Name of the catalog to use"},
+        },
+        "required": ["catalog_name"],
+    },
+)
 def use_catalog(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Set the active catalog context."""
     catalog_name = args.get("catalog_name")
@@ -27,6 +73,14 @@ def use_catalog(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Di
     return new_state, {"success": True, "active_catalog": catalog_name}
 
 
+@tool_spec(
+    description="List all catalogs in the workspace",
+    parameters={
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+)
 def list_catalogs(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List all catalogs."""
     catalog_list = [
@@ -40,6 +94,18 @@ def list_catalogs(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
     return state, {"catalogs": catalog_list}
 
 
+@tool_spec(
+    description="Create a new Unity Catalog catalog",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "owner": {"type": "string", "description": "Owner of the catalog", "default": "admin"},
+            "comment": {"type": "string", "description": "Comment describing the catalog"},
+        },
+        "required": ["catalog_name"],
+    },
+)
 def create_catalog(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a new catalog."""
     catalog_name = args.get("catalog_name")
@@ -56,12 +122,21 @@ def create_catalog(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
     new_catalog = Catalog(
         name=catalog_name, owner=owner, type=catalog_type, comment=comment
     )
-    new_catalogs = {**state.catalogs, catalog_name: new_catalog}
-    new_state = state.model_copy(update={"catalogs": new_catalogs})
+    new_state = _set_entry(state, "catalogs", catalog_name, new_catalog)
 
     return new_state, {"success": True, "catalog": catalog_name}
 
 
+@tool_spec(
+    description="List all schemas in a catalog",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+        },
+        "required": ["catalog_name"],
+    },
+)
 def list_schemas(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List schemas in a catalog."""
     catalog_name = args.get("catalog_name")
@@ -78,12 +153,24 @@ def list_schemas(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, D
             "owner": schema.owner,
             "comment": schema.comment,
         }
-        for key, schema in state.schemas.items()
-        if schema.catalog_name == catalog_name
+        for schema in state.schemas_in(catalog_name)
     ]
     return state, {"schemas": schema_list}
 
 
+@tool_spec(
+    description="Create a schema in a catalog",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "schema_name": _SCHEMA_NAME_PROP,
+            "owner": {"type": "string", "description": "Owner of the schema", "default": "admin"},
+            "comment": {"type": "string", "description": "Comment describing the schema"},
+        },
+        "required": ["catalog_name", "schema_name"],
+    },
+)
 def create_schema(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a schema in a catalog."""
     catalog_name = args.get("catalog_name")
@@ -107,12 +194,22 @@ def create_schema(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
         owner=owner,
         comment=comment,
     )
-    new_schemas = {**state.schemas, schema_key: new_schema}
-    new_state = state.model_copy(update={"schemas": new_schemas})
+    new_state = _set_entry(state, "schemas", schema_key, new_schema)
 
     return new_state, {"success": True, "schema": schema_key}
 
 
+@tool_spec(
+    description="List all tables in a catalog.schema",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "schema_name": _SCHEMA_NAME_PROP,
+        },
+        "required": ["catalog_name", "schema_name"],
+    },
+)
 def list_tables(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List tables in a catalog.schema."""
     catalog_name = args.get("catalog_name")
@@ -133,12 +230,38 @@ def list_tables(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Di
             "owner": table.owner,
             "column_count": len(table.columns),
         }
-        for key, table in state.tables.items()
-        if table.catalog_name == catalog_name and table.schema_name == schema_name
+        for table in state.tables_in(catalog_name, schema_name)
     ]
     return state, {"tables": table_list}
 
 
+@tool_spec(
+    description="Create a table with schema in a catalog.schema",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "schema_name": _SCHEMA_NAME_PROP,
+            "table_name": _TABLE_NAME_PROP,
+            "columns": {
+                "type": "array",
+                "description": "List of column definitions",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "type": {"type": "string", "default": "STRING"},
+                        "nullable": {"type": "boolean", "default": True},
+                        "comment": {"type": "string"},
+                    },
+                    "required": ["name"],
+                },
+            },
+            "owner": {"type": "string", "description": "Owner of the table", "default": "admin"},
+        },
+        "required": ["catalog_name", "schema_name", "table_name", "columns"],
+    },
+)
 def create_table(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a table with schema."""
     catalog_name = args.get("catalog_name")
@@ -160,18 +283,22 @@ def create_table(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, D
     if table_key in state.tables:
         return state, {"error": f"Table '{table_key}' already exists"}
 
-    # Convert column dicts to Column objects
-    from .state import Column
-
-    column_objects = [
-        Column(
-            name=col.get("name"),
-            type=col.get("type", "STRING"),
-            nullable=col.get("nullable", True),
-            comment=col.get("comment"),
+    if any(not isinstance(col.get("name"), str) for col in columns):
+        return state, {"error": "Every column requires a name"}
+
+    # Convert column dicts to Column objects, which check the remaining fields
+    try:
+        column_objects = tuple(
+            Column(
+                name=col.get("name"),
+                type=col.get("type", "STRING"),
+                nullable=col.get("nullable", True),
+                comment=col.get("comment"),
+            )
+            for col in columns
         )
-        for col in columns
-    ]
+    except TypeError as e:
+        return state, {"error": str(e)}
 
     new_table = Table(
         catalog_name=catalog_name,
@@ -180,12 +307,28 @@ def create_table(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, D
         columns=column_objects,
         owner=owner,
     )
-    new_tables = {**state.tables, table_key: new_table}
-    new_state = state.model_copy(update={"tables": new_tables})
+    new_state = _set_entry(state, "tables", table_key, new_table)
 
     return new_state, {"success": True, "table": table_key}
 
 
+@tool_spec(
+    description="Insert data rows into a table",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "schema_name": _SCHEMA_NAME_PROP,
+            "table_name": _TABLE_NAME_PROP,
+            "rows": {
+                "type": "array",
+                "description": "List of rows to insert (each row is a list of values)",
+                "items": {"type": "array"},
+            },
+        },
+        "required": ["catalog_name", "schema_name", "table_name", "rows"],
+    },
+)
 def insert_into_table(
     state: DatabricksState, args: Dict
 ) -> Tuple[DatabricksState, Dict]:
@@ -208,25 +351,38 @@ def insert_into_table(
     if not rows:
         return state, {"error": "No rows provided"}
 
-    # Convert rows to dicts matching column names
-    column_names = [col.name for col in table.columns]
-    new_rows = []
+    # Convert rows to dicts matching column names; the names tuple is cached
+    # on the table, and its width is read once for the whole batch
+    column_names = table.columns_soa[0]
+    width = len(column_names)
     for row in rows:
-        if len(row) != len(column_names):
+        if len(row) != width:
             return state, {
-                "error": f"Row has {len(row)} values but table has {len(column_names)} columns"
+                "error": f"Row has {len(row)} values but table has {width} columns"
             }
-        new_rows.append(dict(zip(column_names, row)))
+    new_rows = [dict(zip(column_names, row)) for row in rows]
 
     # Update table with new data
-    updated_data = list(table.data) + new_rows
+    updated_data = [*table.data, *new_rows]
     updated_table = table.model_copy(update={"data": updated_data})
-    new_tables = {**state.tables, table_key: updated_table}
-    new_state = state.model_copy(update={"tables": new_tables})
+    new_state = _set_entry(state, "tables", table_key, updated_table)
 
     return new_state, {"success": True, "rows_inserted": len(new_rows)}
 
 
+@tool_spec(
+    description="Query a table (SELECT operation)",
+    parameters={
+        "type": "object",
+        "properties": {
+            "catalog_name": _CATALOG_NAME_PROP,
+            "schema_name": _SCHEMA_NAME_PROP,
+            "table_name": _TABLE_NAME_PROP,
+            "query": {"type": "string", "description": "Optional filter query"},
+        },
+        "required": ["catalog_name", "schema_name", "table_name"],
+    },
+)
 def query_table(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Query a table (SELECT operation)."""
     catalog_name = args.get("catalog_name")
@@ -256,6 +412,28 @@ def query_table(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Di
     return state, {"results": results, "row_count": len(results)}
 
 
+@tool_spec(
+    description="Grant a privilege to a principal on a securable",
+    parameters={
+        "type": "object",
+        "properties": {
+            "privilege": {
+                "type": "string",
+                "description": "Privilege to grant (e.g., SELECT, INSERT, ALL_PRIVILEGES)",
+            },
+            "securable_type": {
+                "type": "string",
+                "description": "Type of securable (TABLE, CATALOG, SCHEMA)",
+            },
+            "securable_name": {
+                "type": "string",
+                "description": "Full name of securable (e.g., catalog.schema.table)",
+            },
+            "principal": _PRINCIPAL_PROP,
+        },
+        "required": ["privilege", "securable_type", "securable_name", "principal"],
+    },
+)
 def grant_privilege(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Grant a privilege to a principal."""
     privilege = args.get("privilege")
@@ -269,17 +447,7 @@ def grant_privilege(state: DatabricksState, args: Dict) -> Tuple[DatabricksState
         }
 
     # Check if permission already exists
-    existing_permission = next(
-        (
-            p
-            for p in state.permissions
-            if p.principal == principal
-            and p.securable_name == securable_name
-            and p.privilege == privilege
-        ),
-        None,
-    )
-    if existing_permission:
+    if (principal, privilege, securable_name) in state.permission_keys:
         return state, {"error": "Permission already granted"}
 
     new_permission = Permission(
@@ -288,7 +456,7 @@ def grant_privilege(state: DatabricksState, args: Dict) -> Tuple[DatabricksState
         securable_type=securable_type,
         securable_name=securable_name,
     )
-    new_permissions = list(state.permissions) + [new_permission]
+    new_permissions = [*state.permissions, new_permission]
     new_state = state.model_copy(update={"permissions": new_permissions})
 
     return new_state, {
@@ -297,6 +465,18 @@ def grant_privilege(state: DatabricksState, args: Dict) -> Tuple[DatabricksState
     }
 
 
+@tool_spec(
+    description="Revoke a privilege from a principal",
+    parameters={
+        "type": "object",
+        "properties": {
+            "privilege": {"type": "string", "description": "Privilege to revoke"},
+            "securable_name": {"type": "string", "description": "Full name of securable"},
+            "principal": _PRINCIPAL_PROP,
+        },
+        "required": ["privilege", "securable_name", "principal"],
+    },
+)
 def revoke_privilege(
     state: DatabricksState, args: Dict
 ) -> Tuple[DatabricksState, Dict]:
@@ -308,6 +488,9 @@ def revoke_privilege(
     if not all([privilege, securable_name, principal]):
         return state, {"error": "privilege, securable_name, and principal are required"}
 
+    if (principal, privilege, securable_name) not in state.permission_keys:
+        return state, {"error": "Permission not found"}
+
     new_permissions = [
         p
         for p in state.permissions
@@ -317,14 +500,26 @@ def revoke_privilege(
             and p.privilege == privilege
         )
     ]
-
-    if len(new_permissions) == len(state.permissions):
-        return state, {"error": "Permission not found"}
-
     new_state = state.model_copy(update={"permissions": new_permissions})
     return new_state, {"success": True}
 
 
+@tool_spec(
+    description="Create a new notebook",
+    parameters={
+        "type": "object",
+        "properties": {
+            "path": {"type": "string", "description": "Path to the notebook"},
+            "language": {
+                "type": "string",
+                "description": "Notebook language",
+                "enum": ["sql", "python", "scala", "r"],
+                "default": "python",
+            },
+        },
+        "required": ["path"],
+    },
+)
 def create_notebook(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a notebook."""
     path = args.get("path")
@@ -337,12 +532,19 @@ def create_notebook(state: DatabricksState, args: Dict) -> Tuple[DatabricksState
         return state, {"error": f"Notebook '{path}' already exists"}
 
     new_notebook = Notebook(path=path, language=language)
-    new_notebooks = {**state.notebooks, path: new_notebook}
-    new_state = state.model_copy(update={"notebooks": new_notebooks})
+    new_state = _set_entry(state, "notebooks", path, new_notebook)
 
     return new_state, {"success": True, "notebook": path}
 
 
+@tool_spec(
+    description="List all notebooks",
+    parameters={
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+)
 def list_notebooks(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List all notebooks."""
     notebook_list = [
@@ -357,6 +559,17 @@ def list_notebooks(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
     return state, {"notebooks": notebook_list}
 
 
+@tool_spec(
+    description="Execute a notebook cell",
+    parameters={
+        "type": "object",
+        "properties": {
+            "notebook_path": _NOTEBOOK_PATH_PROP,
+            "cell_content": {"type": "string", "description": "Content of the cell to execute"},
+        },
+        "required": ["notebook_path", "cell_content"],
+    },
+)
 def run_notebook_cell(
     state: DatabricksState, args: Dict
 ) -> Tuple[DatabricksState, Dict]:
@@ -371,14 +584,32 @@ def run_notebook_cell(
         return state, {"error": f"Notebook '{notebook_path}' does not exist"}
 
     notebook = state.notebooks[notebook_path]
-    new_cells = list(notebook.cells) + [cell_content]
+    new_cells = [*notebook.cells, cell_content]
     updated_notebook = notebook.model_copy(update={"cells": new_cells})
-    new_notebooks = {**state.notebooks, notebook_path: updated_notebook}
-    new_state = state.model_copy(update={"notebooks": new_notebooks})
+    new_state = _set_entry(state, "notebooks", notebook_path, updated_notebook)
 
     return new_state, {"success": True, "cell_executed": True}
 
 
+@tool_spec(
+    description="Create a visualization in a notebook",
+    parameters={
+        "type": "object",
+        "properties": {
+            "notebook_path": _NOTEBOOK_PATH_PROP,
+            "visualization_type": {
+                "type": "string",
+                "description": "Type of visualization",
+                "enum": ["bar", "line", "pie", "scatter"],
+                "default": "bar",
+            },
+            "x_column": {"type": "string", "description": "Column for X axis"},
+            "y_column": {"type": "string", "description": "Column for Y axis"},
+            "group_by": {"type": "string", "description": "Column to group by"},
+        },
+        "required": ["notebook_path"],
+    },
+)
 def create_visualization(
     state: DatabricksState, args: Dict
 ) -> Tuple[DatabricksState, Dict]:
@@ -398,14 +629,21 @@ def create_visualization(
     # Visualization is stored as metadata in notebook cells
     viz_cell = f"VISUALIZATION: type={visualization_type}, x={x_column}, y={y_column}, group_by={group_by}"
     notebook = state.notebooks[notebook_path]
-    new_cells = list(notebook.cells) + [viz_cell]
+    new_cells = [*notebook.cells, viz_cell]
     updated_notebook = notebook.model_copy(update={"cells": new_cells})
-    new_notebooks = {**state.notebooks, notebook_path: updated_notebook}
-    new_state = state.model_copy(update={"notebooks": new_notebooks})
+    new_state = _set_entry(state, "notebooks", notebook_path, updated_notebook)
 
     return new_state, {"success": True, "visualization_created": True}
 
 
+@tool_spec(
+    description="List all compute clusters",
+    parameters={
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+)
 def list_clusters(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List all compute clusters."""
     cluster_list = [
@@ -421,10 +659,21 @@ def list_clusters(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
     return state, {"clusters": cluster_list}
 
 
+@tool_spec(
+    description="Create a compute cluster",
+    parameters={
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "description": "Name of the cluster"},
+            "node_type": {"type": "string", "description": "Node type", "default": "i3.xlarge"},
+            "num_workers": {"type": "integer", "description": "Number of worker nodes", "default": 1},
+            "spark_version": {"type": "string", "description": "Spark version", "default": "13.3.x-scala2.12"},
+        },
+        "required": ["name"],
+    },
+)
 def create_cluster(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a compute cluster."""
-    import uuid
-
     name = args.get("name")
     node_type = args.get("node_type", "i3.xlarge")
     num_workers = args.get("num_workers", 1)
@@ -442,12 +691,22 @@ def create_cluster(state: DatabricksState, args: Dict) -> Tuple[DatabricksState,
         num_workers=num_workers,
         spark_version=spark_version,
     )
-    new_clusters = {**state.clusters, cluster_id: new_cluster}
-    new_state = state.model_copy(update={"clusters": new_clusters})
+    new_state = _set_entry(state, "clusters", cluster_id, new_cluster)
 
     return new_state, {"success": True, "cluster_id": cluster_id}
 
 
+@tool_spec(
+    description="Attach a notebook to a cluster",
+    parameters={
+        "type": "object",
+        "properties": {
+            "notebook_path": _NOTEBOOK_PATH_PROP,
+            "cluster_id": {"type": "string", "description": "ID of the cluster"},
+        },
+        "required": ["notebook_path", "cluster_id"],
+    },
+)
 def attach_to_cluster(
     state: DatabricksState, args: Dict
 ) -> Tuple[DatabricksState, Dict]:
@@ -466,12 +725,19 @@ def attach_to_cluster(
 
     notebook = state.notebooks[notebook_path]
     updated_notebook = notebook.model_copy(update={"attached_cluster_id": cluster_id})
-    new_notebooks = {**state.notebooks, notebook_path: updated_notebook}
-    new_state = state.model_copy(update={"notebooks": new_notebooks})
+    new_state = _set_entry(state, "notebooks", notebook_path, updated_notebook)
 
     return new_state, {"success": True, "attached": True}
 
 
+@tool_spec(
+    description="List all scheduled jobs",
+    parameters={
+        "type": "object",
+        "properties": {},
+        "required": [],
+    },
+)
 def list_jobs(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """List all scheduled jobs."""
     job_list = [
@@ -486,10 +752,24 @@ def list_jobs(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict
     return state, {"jobs": job_list}
 
 
+@tool_spec(
+    description="Create a scheduled job",
+    parameters={
+        "type": "object",
+        "properties": {
+            "name": {"type": "string", "description": "Name of the job"},
+            "schedule": {"type": "string", "description": "Cron expression for schedule"},
+            "tasks": {
+                "type": "array",
+                "description": "List of tasks for the job",
+                "items": {"type": "object"},
+            },
+        },
+        "required": ["name"],
+    },
+)
 def create_job(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dict]:
     """Create a scheduled job."""
-    import uuid
-
     name = args.get("name")
     schedule = args.get("schedule")
     tasks = args.get("tasks", [])
@@ -499,7 +779,6 @@ def create_job(state: DatabricksState, args: Dict) -> Tuple[DatabricksState, Dic
 
     job_id = str(uuid.uuid4())
     new_job = Job(job_id=job_id, name=name, schedule=schedule, tasks=tasks)
-    new_jobs = {**state.jobs, job_id: new_job}
-    new_state = state.model_copy(update={"jobs": new_jobs})
+    new_state = _set_entry(state, "jobs", job_id, new_job)
 
     return new_state, {"success": True, "job_id": job_id}
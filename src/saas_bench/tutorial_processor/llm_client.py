@@ -1,27 +1,67 @@
 """LLM client wrapper for Grok API using OpenAI SDK."""
 
+import asyncio
+import json
 import os
-from typing import Type
+from functools import cached_property, lru_cache
+from typing import List, Sequence, Type
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
 
+@lru_cache(maxsize=128)
+def _json_schema_instructions(response_model: Type[BaseModel]) -> str:
+    """JSON-mode prompt suffix for a response model's schema, built once per model."""
+    schema = response_model.model_json_schema()
+    return f"""Please respond with a valid JSON object that matches this schema:
+{json.dumps(schema, indent=2)}
+
+Return ONLY the JSON object, no additional text or markdown formatting."""
+
+
 class GrokClient:
     """Wrapper around OpenAI SDK configured for Grok endpoints."""
 
-    def __init__(self):
-        """Initialize Grok client with API key from environment."""
+    def __init__(
+        self,
+        model: str = "grok-4-1-fast-reasoning",
+        fallback_model: str = "grok-3",
+    ):
+        """Initialize Grok client with API key from environment.
+
+        Args:
+            model: Model used for completions and structured outputs
+            fallback_model: Model used for the JSON-mode structured output fallback
+        """
         api_key = os.getenv("GROK_API_KEY")
         base_url = os.getenv("GROK_BASE_URL", "https://api.x.ai/v1")
 
         if not api_key:
             raise ValueError("GROK_API_KEY environment variable not set")
 
+        self.model = model
+        self.fallback_model = fallback_model
+        self._api_key = api_key
+        self._base_url = base_url
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        # Whether the SDK exposes beta structured outputs; probed once, here
+        self._supports_parse = hasattr(self.client, "beta") and hasattr(
+            self.client.beta, "chat"
+        )
+
+    @cached_property
+    def async_client(self) -> AsyncOpenAI:
+        """Async SDK client, created on first use so sync callers never build it."""
+        return AsyncOpenAI(api_key=self._api_key, base_url=self._base_url)
 
     def chat_completion(self, prompt: str, system: str = "") -> str:
         """Basic text completion."""
@@ -31,44 +71,72 @@ class GrokClient:
         messages.append({"role": "user", "content": prompt})
 
         response = self.client.chat.completions.create(
-            model="grok-4-1-fast-reasoning",
+            model=self.model,
+            messages=messages,
+        )
+
+        return response.choices[0].message.content or ""
+
+    async def achat_completion(self, prompt: str, system: str = "") -> str:
+        """Basic text completion without blocking the event loop."""
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
             messages=messages,
         )
 
         return response.choices[0].message.content or ""
 
+    async def chat_completion_many(
+        self, prompts: Sequence[str], system: str = "", concurrency: int = 8
+    ) -> List[str]:
+        """Run text completions concurrently, returning results in prompt order.
+
+        Args:
+            prompts: User prompts, one completion each
+            system: System prompt shared by every completion
+            concurrency: Maximum number of requests in flight at once
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def complete(prompt: str) -> str:
+            async with semaphore:
+                return await self.achat_completion(prompt, system)
+
+        return list(await asyncio.gather(*(complete(prompt) for prompt in prompts)))
+
     def structured_output(
         self, prompt: str, system: str, response_model: Type[BaseModel]
     ) -> BaseModel:
         """Get structured output using OpenAI SDK's structured outputs feature."""
-        import json
-
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
 
         # Try beta structured outputs API first
-        try:
-            if hasattr(self.client, "beta") and hasattr(self.client.beta, "chat"):
+        if self._supports_parse:
+            try:
                 response = self.client.beta.chat.completions.parse(
-                    model="grok-4-1-fast-reasoning",
+                    model=self.model,
                     messages=messages,
                     response_format=response_model,
                 )
                 return response.choices[0].message.parsed
-        except (AttributeError, Exception):
-            pass
+            except Exception:
+                # Fall back to JSON mode for this call only; the next call
+                # tries structured outputs again
+                pass
 
         # Fallback: Use JSON mode and parse manually
         # Add instruction to return JSON matching the schema
-        schema = response_model.model_json_schema()
         json_prompt = f"""{prompt}
 
-Please respond with a valid JSON object that matches this schema:
-{json.dumps(schema, indent=2)}
-
-Return ONLY the JSON object, no additional text or markdown formatting."""
+{_json_schema_instructions(response_model)}"""
 
         messages_with_json = []
         if system:
@@ -76,7 +144,7 @@ Return ONLY the JSON object, no additional text or markdown formatting."""
         messages_with_json.append({"role": "user", "content": json_prompt})
 
         response = self.client.chat.completions.create(
-            model="grok-3",
+            model=self.fallback_model,
             messages=messages_with_json,
             response_format={"type": "json_object"},
         )
@@ -90,5 +158,7 @@ Return ONLY the JSON object, no additional text or markdown formatting."""
             content = "\n".join(lines[1:-1]) if len(lines) > 2 else content
 
         # Parse JSON and create Pydantic model
-        json_data = json.loads(content)
+        # orjson's decode error subclasses json.JSONDecodeError, so callers see
+        # the same exception either way
+        json_data = orjson.loads(content) if orjson is not None else json.loads(content)
         return response_model(**json_data)
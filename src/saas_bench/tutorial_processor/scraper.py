@@ -1,28 +1,100 @@
 """Web scraper for extracting tutorial content from Databricks documentation."""
 
+import hashlib
+import os
 import re
-from typing import Optional
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+try:
+    import lxml  # noqa: F401
+
+    # C parser, used by BeautifulSoup when available
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Status codes worth retrying; other 4xx responses will not change on retry
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+DEFAULT_CACHE_DIR = ".cache/tutorials"
+
+# Patterns used on every scrape, compiled once
+_CONTENT_CLASS_PATTERN = re.compile("content|main")
+_STEP_PATTERN = re.compile(r"step \d+", re.IGNORECASE)
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+_SPACES_PATTERN = re.compile(r" {2,}")
+_SQL_BLOCK_PATTERN = re.compile(
+    r"```(?:sql)?\s*\n(.*?)\n```", re.DOTALL | re.IGNORECASE
+)
+
+# Connections per host kept alive between fetches; covers the batch script's
+# default of 8 concurrent scrapes with room to spare
+POOL_SIZE = 16
+
+
+def _make_session() -> requests.Session:
+    """Build the session shared by all fetches so connections are reused."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+# Set to a non-empty value other than "0" to ignore cached tutorials, as if
+# refresh=True were passed to scrape_tutorial_cached
+REFRESH_ENV_VAR = "SAAS_BENCH_REFRESH_TUTORIALS"
+
+# In-process copies of tutorials already read or scraped, keyed by cache file
+# path: (text, time fetched)
+_memory_cache: Dict[Path, Tuple[str, float]] = {}
+_memory_cache_lock = threading.Lock()
+
+
+def fetch_page(url: str, retries: int = 3, backoff: float = 1.0) -> bytes:
+    """Fetch a page, retrying transient failures with exponential backoff."""
+    for attempt in range(retries):
+        try:
+            response = _SESSION.get(url, timeout=10)
+            response.raise_for_status()
+            return response.content
+        except requests.RequestException as e:
+            # Only network errors and the listed statuses are worth retrying;
+            # e.g. a malformed URL fails the same way every time
+            status = e.response.status_code if e.response is not None else None
+            retryable = (
+                isinstance(e, (requests.ConnectionError, requests.Timeout))
+                or status in RETRYABLE_STATUS_CODES
+            )
+            if not retryable or attempt == retries - 1:
+                raise ValueError(f"Failed to fetch URL: {e}")
+            time.sleep(backoff * 2**attempt)
+
+    raise ValueError(f"Failed to fetch URL: {url}")
 
 
 def scrape_tutorial(url: str) -> str:
     """Extract tutorial content from Databricks documentation pages."""
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        raise ValueError(f"Failed to fetch URL: {e}")
+    content = fetch_page(url)
 
-    soup = BeautifulSoup(response.content, "html.parser")
+    soup = BeautifulSoup(content, HTML_PARSER)
 
     # Remove script and style elements
     for script in soup(["script", "style", "nav", "footer", "header"]):
         script.decompose()
 
     # Try to find main content area (Databricks docs structure)
-    main_content = soup.find("main") or soup.find("article") or soup.find("div", class_=re.compile("content|main"))
+    main_content = soup.find("main") or soup.find("article") or soup.find("div", class_=_CONTENT_CLASS_PATTERN)
 
     if not main_content:
         # Fallback: use body
@@ -39,9 +111,12 @@ def scrape_tutorial(url: str) -> str:
     if title:
         text_parts.append(f"# {title.get_text().strip()}\n")
 
+    # Both passes below walk the same section headings
+    headings = main_content.find_all(["h2", "h3"])
+
     # Extract prerequisites/requirements section
     prerequisites_section = None
-    for heading in main_content.find_all(["h2", "h3"]):
+    for heading in headings:
         heading_text = heading.get_text().strip().lower()
         if "before you begin" in heading_text or "requirements" in heading_text or "prerequisites" in heading_text:
             prerequisites_section = heading
@@ -57,10 +132,9 @@ def scrape_tutorial(url: str) -> str:
             break
 
     # Extract step-by-step instructions
-    step_pattern = re.compile(r"step \d+", re.IGNORECASE)
-    for heading in main_content.find_all(["h2", "h3"]):
+    for heading in headings:
         heading_text = heading.get_text().strip()
-        if step_pattern.search(heading_text):
+        if _STEP_PATTERN.search(heading_text):
             text_parts.append(f"\n## {heading_text}\n")
             # Get content until next heading
             for sibling in heading.next_siblings:
@@ -83,16 +157,68 @@ def scrape_tutorial(url: str) -> str:
     # Clean up text
     full_text = "\n".join(text_parts)
     # Remove excessive whitespace
-    full_text = re.sub(r"\n{3,}", "\n\n", full_text)
+    full_text = _BLANK_LINES_PATTERN.sub("\n\n", full_text)
     # Remove excessive spaces
-    full_text = re.sub(r" {2,}", " ", full_text)
+    full_text = _SPACES_PATTERN.sub(" ", full_text)
 
     return full_text.strip()
 
 
+def scrape_tutorial_cached(
+    url: str,
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    max_age: Optional[float] = None,
+    refresh: bool = False,
+) -> tuple[str, bool]:
+    """Scrape a tutorial, reusing a copy cached on disk under a hash of its URL.
+
+    Args:
+        url: Tutorial URL
+        cache_dir: Directory holding cached tutorial text
+        max_age: Maximum age of a cached entry in seconds (None means no expiry)
+        refresh: If True, ignore any cached entry and fetch the page again
+
+    Entries are also kept in memory for the life of the process, so repeat
+    lookups skip the disk read. Setting the SAAS_BENCH_REFRESH_TUTORIALS
+    environment variable bypasses both caches.
+
+    Returns:
+        Tuple of (tutorial text, whether it was served from the cache)
+    """
+    refresh = refresh or os.getenv(REFRESH_ENV_VAR, "") not in ("", "0")
+    cache_path = Path(cache_dir) / f"{hashlib.sha256(url.encode()).hexdigest()}.txt"
+
+    if not refresh:
+        with _memory_cache_lock:
+            entry = _memory_cache.get(cache_path)
+        if entry is not None and (max_age is None or time.time() - entry[1] <= max_age):
+            return entry[0], True
+
+        if cache_path.exists():
+            fetched_at = os.path.getmtime(cache_path)
+            if max_age is None or time.time() - fetched_at <= max_age:
+                text = cache_path.read_text(encoding="utf-8")
+                with _memory_cache_lock:
+                    _memory_cache[cache_path] = (text, fetched_at)
+                return text, True
+
+    text = scrape_tutorial(url)
+    with _memory_cache_lock:
+        _memory_cache[cache_path] = (text, time.time())
+
+    # Write atomically so an interrupted run never leaves a truncated entry
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+    ) as tmp:
+        tmp.write(text)
+    os.replace(tmp.name, cache_path)
+
+    return text, False
+
+
 def extract_sql_commands(text: str) -> list[str]:
     """Extract SQL commands from tutorial text."""
-    sql_pattern = re.compile(r"```(?:sql)?\s*\n(.*?)\n```", re.DOTALL | re.IGNORECASE)
-    matches = sql_pattern.findall(text)
+    matches = _SQL_BLOCK_PATTERN.findall(text)
     return [match.strip() for match in matches if match.strip()]
 
@@ -1,13 +1,22 @@
 """Extract workflows from tutorial text using LLM with structured outputs."""
 
-import re
+import asyncio
+import os
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from pydantic import BaseModel, Field
 
+from ..utils.cached_views import CachedViewsModel
 from .llm_client import GrokClient
 
+# POSIX-only; without it the ID counter is still used, just not locked
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 class WorkflowStep(BaseModel):
     """A single step in a workflow."""
@@ -18,18 +27,40 @@ class WorkflowStep(BaseModel):
     sql_command: Optional[str] = Field(
         None, description="Original SQL command if applicable"
     )
-    api_call: Dict = Field(
+    api_call: Dict[str, Any] = Field(
         description="API call specification with tool name and parameters"
     )
-    expected_state_change: Dict = Field(
+    expected_state_change: Dict[str, Any] = Field(
         default_factory=dict, description="Expected state changes"
     )
-    verification: Dict = Field(
+    verification: Dict[str, Any] = Field(
         default_factory=dict, description="How to verify this step succeeded"
     )
 
 
-class Workflow(BaseModel):
+def _merge_shared(base: Dict, update: Dict) -> Dict:
+    """Deep merge update into base, sharing every subtree the merge doesn't change.
+
+    Only dicts present on both sides are copied (shallowly, one level at a
+    time); all other values are shared with base or update, so neither input
+    nor the result may be mutated afterwards. Iterative, so deep states don't
+    recurse.
+    """
+    result = dict(base)
+    pending = [(result, update)]
+    while pending:
+        target, changes = pending.pop()
+        for key, value in changes.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = target[key] = dict(current)
+                pending.append((merged, value))
+            else:
+                target[key] = value
+    return result
+
+
+class Workflow(CachedViewsModel):
     """Complete workflow extracted from tutorial."""
 
     id: str = Field(description="Unique workflow identifier")
@@ -40,38 +71,114 @@ class Workflow(BaseModel):
     prerequisites: List[str] = Field(
         default_factory=list, description="Prerequisites from tutorial"
     )
-    initial_state: Dict = Field(default_factory=dict, description="Starting state")
-    goal_state: Dict = Field(description="Final desired state")
+    initial_state: Dict[str, Any] = Field(
+        default_factory=dict, description="Starting state"
+    )
+    goal_state: Dict[str, Any] = Field(description="Final desired state")
     steps: List[WorkflowStep] = Field(description="Step-by-step instructions")
 
+    @cached_property
+    def cumulative_states(self) -> Tuple[List[int], List[Dict[str, Any]]]:
+        """Step IDs in order, and the state after each prefix of steps.
 
-def generate_next_workflow_id(output_dir: str = "workflows/databricks") -> str:
-    """Generate the next sequential workflow ID in format databricks-XXX."""
+        states[0] is the initial state and states[i] the state after the first
+        i steps by step_id. Computed once per workflow; the states share
+        structure with each other and with the workflow, so never modify them.
+        """
+        ordered = sorted(self.steps, key=lambda step: step.step_id)
+        step_ids = [step.step_id for step in ordered]
+        state = self.initial_state or {}
+        states = [state]
+        for step in ordered:
+            if step.expected_state_change:
+                state = _merge_shared(state, step.expected_state_change)
+            states.append(state)
+        return step_ids, states
+
+
+# File in each output directory holding the next workflow number to hand out
+ID_COUNTER_FILE = ".next_id"
+
+
+def _next_workflow_number(output_dir: str) -> int:
+    """Number after the highest databricks-XXX workflow file in output_dir."""
+    output_path = Path(output_dir)
+
+    # Match databricks-XXX.yaml names by slicing: one directory scan, no
+    # per-entry stat and no regex
+    prefix, suffix = "databricks-", ".yaml"
+    max_num = 0
+    with os.scandir(output_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix):
+                digits = name[len(prefix) : -len(suffix)]
+                # isdecimal() accepts the same characters as the regex \d
+                if digits.isdecimal():
+                    max_num = max(max_num, int(digits))
+
+    return max_num + 1
+
+
+def _format_workflow_id(number: int) -> str:
+    """Workflow ID with a zero-padded 3 digit number."""
+    return f"databricks-{number:03d}"
+
+
+def _reserve_workflow_numbers(output_dir: str, count: int = 1) -> int:
+    """Reserve count consecutive workflow numbers in output_dir; return the first.
+
+    The next free number is kept in ID_COUNTER_FILE and updated under an
+    exclusive lock, so concurrent callers never get the same number and the
+    directory is not scanned on every call. It is scanned only to create the
+    counter, or when a reserved number's file already exists (e.g. workflows
+    added by hand or pulled from git).
+    """
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Pattern to match databricks-XXX.yaml files
-    pattern = re.compile(r"^databricks-(\d+)\.yaml$")
+    fd = os.open(output_path / ID_COUNTER_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+    with os.fdopen(fd, "r+") as counter:
+        # Released when the file is closed
+        if fcntl is not None:
+            fcntl.flock(counter, fcntl.LOCK_EX)
 
-    max_num = 0
-    for file_path in output_path.glob("databricks-*.yaml"):
-        match = pattern.match(file_path.name)
-        if match:
-            num = int(match.group(1))
-            max_num = max(max_num, num)
+        content = counter.read().strip()
+        if content.isdecimal():
+            first = int(content)
+        else:
+            first = _next_workflow_number(output_dir)
 
-    # Return next ID with zero-padded 3 digits
-    next_num = max_num + 1
-    return f"databricks-{next_num:03d}"
+        if any(
+            (output_path / f"{_format_workflow_id(number)}.yaml").exists()
+            for number in range(first, first + count)
+        ):
+            first = max(first, _next_workflow_number(output_dir))
 
+        counter.seek(0)
+        counter.truncate()
+        counter.write(str(first + count))
 
-def extract_workflow(
-    tutorial_text: str, source_url: str, output_dir: str = "workflows/databricks"
-) -> Workflow:
-    """Extract workflow from tutorial text using LLM with structured outputs."""
-    client = GrokClient()
+    return first
 
-    system_prompt = """You are an expert at analyzing SaaS platform tutorials and extracting structured workflows.
+
+def generate_next_workflow_id(output_dir: str = "workflows/databricks") -> str:
+    """Reserve the next sequential workflow ID in format databricks-XXX.
+
+    Each call returns a new ID, even if the previous one was never saved.
+    """
+    return _format_workflow_id(_reserve_workflow_numbers(output_dir))
+
+
+class WorkflowBatch(BaseModel):
+    """Workflows extracted from several tutorials in one LLM request."""
+
+    workflows: List[Workflow] = Field(
+        description="One workflow per tutorial, in the order they were given"
+    )
+
+
+_SYSTEM_PROMPT = """You are an expert at analyzing SaaS platform tutorials and extracting structured workflows.
 
 Your task is to analyze a Databricks tutorial and extract a complete workflow specification.
 
@@ -93,6 +200,23 @@ Key requirements:
 
 Generate a complete workflow specification following the Workflow schema."""
 
+_BATCH_SYSTEM_PROMPT = (
+    _SYSTEM_PROMPT
+    + """
+
+You will be given several numbered tutorials. Extract one workflow per tutorial
+and return them in the same order, as the workflows list of a WorkflowBatch."""
+)
+
+_EXTRACTION_CHECKLIST = """- All prerequisites
+- Step-by-step instructions with API tool mappings
+- Expected state changes for each step
+- Initial state (starting conditions)
+- Goal state (desired end result)"""
+
+
+def _build_prompts(tutorial_text: str, source_url: str) -> Tuple[str, str]:
+    """System and user prompts asking the LLM to extract one workflow."""
     user_prompt = f"""Analyze the following Databricks tutorial and extract a complete workflow:
 
 Tutorial URL: {source_url}
@@ -101,20 +225,179 @@ Tutorial Content:
 {tutorial_text}
 
 Extract the workflow with:
-- All prerequisites
-- Step-by-step instructions with API tool mappings
-- Expected state changes for each step
-- Initial state (starting conditions)
-- Goal state (desired end result)"""
+{_EXTRACTION_CHECKLIST}"""
+
+    return _SYSTEM_PROMPT, user_prompt
+
 
+def _build_batch_prompts(tutorials: Sequence[Tuple[str, str]]) -> Tuple[str, str]:
+    """System and user prompts asking the LLM to extract one workflow per tutorial."""
+    sections = "\n\n".join(
+        f"""Tutorial {number}
+Tutorial URL: {source_url}
+
+Tutorial Content:
+{tutorial_text}"""
+        for number, (tutorial_text, source_url) in enumerate(tutorials, 1)
+    )
+    user_prompt = f"""Analyze the following {len(tutorials)} Databricks tutorials and extract a complete workflow for each:
+
+{sections}
+
+Extract each workflow with:
+{_EXTRACTION_CHECKLIST}"""
+
+    return _BATCH_SYSTEM_PROMPT, user_prompt
+
+
+def _request_workflow(
+    client: GrokClient, tutorial_text: str, source_url: str
+) -> Workflow:
+    """Ask the LLM for a workflow and make sure its source_url is set."""
+    system_prompt, user_prompt = _build_prompts(tutorial_text, source_url)
     workflow = client.structured_output(user_prompt, system_prompt, Workflow)
 
     # Ensure source_url is set
     if not workflow.source_url:
         workflow = workflow.model_copy(update={"source_url": source_url})
 
-    # Always generate sequential ID (ignore LLM-generated ID)
-    workflow_id = generate_next_workflow_id(output_dir)
-    workflow = workflow.model_copy(update={"id": workflow_id})
-
     return workflow
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> GrokClient:
+    """GrokClient reused by every extract_workflow call, created on first use."""
+    return GrokClient()
+
+
+def extract_workflow(
+    tutorial_text: str,
+    source_url: str,
+    output_dir: str = "workflows/databricks",
+    workflow_id: Optional[str] = None,
+) -> Workflow:
+    """Extract workflow from tutorial text using LLM with structured outputs.
+
+    The LLM-generated ID is always replaced: by workflow_id if given, otherwise
+    by the next sequential ID in output_dir.
+    """
+    workflow = _request_workflow(_shared_client(), tutorial_text, source_url)
+
+    if workflow_id is None:
+        workflow_id = generate_next_workflow_id(output_dir)
+    return workflow.model_copy(update={"id": workflow_id})
+
+
+async def extract_workflows_batch(
+    tutorials: Sequence[Tuple[str, str]],
+    output_dir: str = "workflows/databricks",
+    concurrency: int = 6,
+) -> List[Workflow | Exception]:
+    """Extract workflows from many tutorials concurrently.
+
+    Args:
+        tutorials: (tutorial text, source URL) pairs
+        output_dir: Directory whose existing files determine the next IDs
+        concurrency: Maximum number of LLM requests in flight at once
+
+    Returns:
+        One entry per tutorial, in order: the workflow, or the exception its
+        extraction raised. Successful workflows get consecutive IDs in input
+        order, assigned after every request finishes so they cannot collide.
+    """
+    client = GrokClient()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def extract(tutorial_text: str, source_url: str) -> Workflow:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _request_workflow, client, tutorial_text, source_url
+            )
+
+    results = await asyncio.gather(
+        *(extract(text, url) for text, url in tutorials), return_exceptions=True
+    )
+
+    return _assign_workflow_ids(results, output_dir)
+
+
+def _assign_workflow_ids(
+    results: List[Workflow | Exception], output_dir: str
+) -> List[Workflow | Exception]:
+    """Give the workflows in results consecutive IDs, in order, after output_dir's."""
+    count = sum(isinstance(result, Workflow) for result in results)
+    if not count:
+        return results
+
+    next_number = _reserve_workflow_numbers(output_dir, count)
+    for i, result in enumerate(results):
+        if isinstance(result, Workflow):
+            workflow_id = _format_workflow_id(next_number)
+            results[i] = result.model_copy(update={"id": workflow_id})
+            next_number += 1
+
+    return results
+
+
+def _request_workflow_batch(
+    client: GrokClient, tutorials: Sequence[Tuple[str, str]]
+) -> List[Workflow]:
+    """Ask the LLM for one workflow per tutorial in a single request."""
+    system_prompt, user_prompt = _build_batch_prompts(tutorials)
+    batch = client.structured_output(user_prompt, system_prompt, WorkflowBatch)
+
+    if len(batch.workflows) != len(tutorials):
+        raise ValueError(
+            f"Expected {len(tutorials)} workflows, got {len(batch.workflows)}"
+        )
+
+    workflows = []
+    for workflow, (_, source_url) in zip(batch.workflows, tutorials):
+        # Ensure source_url is set
+        if not workflow.source_url:
+            workflow = workflow.model_copy(update={"source_url": source_url})
+        workflows.append(workflow)
+    return workflows
+
+
+async def extract_workflows_marshaled(
+    tutorials: Sequence[Tuple[str, str]],
+    output_dir: str = "workflows/databricks",
+    batch_size: int = 4,
+    concurrency: int = 6,
+) -> List[Workflow | Exception]:
+    """Extract workflows by packing several tutorials into each LLM request.
+
+    Like extract_workflows_batch, but sends ceil(len(tutorials) / batch_size)
+    requests, which helps under a provider's requests-per-minute limit and
+    sends the system prompt once per batch. Larger batches make each request
+    slower and a bad response costs the whole batch, so keep batch_size small
+    (2-8).
+
+    Returns:
+        One entry per tutorial, in order: the workflow, or the exception its
+        batch raised.
+    """
+    client = GrokClient()
+    semaphore = asyncio.Semaphore(concurrency)
+    batches = [
+        tutorials[start : start + batch_size]
+        for start in range(0, len(tutorials), batch_size)
+    ]
+
+    async def extract(batch: Sequence[Tuple[str, str]]) -> List[Workflow]:
+        async with semaphore:
+            return await asyncio.to_thread(_request_workflow_batch, client, batch)
+
+    batch_results = await asyncio.gather(
+        *(extract(batch) for batch in batches), return_exceptions=True
+    )
+
+    results: List[Workflow | Exception] = []
+    for batch, batch_result in zip(batches, batch_results):
+        if isinstance(batch_result, Exception):
+            results.extend([batch_result] * len(batch))
+        else:
+            results.extend(batch_result)
+
+    return _assign_workflow_ids(results, output_dir)
@@ -1,4 +1,4 @@
-"""Serialize workflows to YAML format."""
+"""Serialize workflows to YAML or JSON files."""
 
 import os
 from pathlib import Path
@@ -7,6 +7,12 @@ import yaml
 
 from .workflow_extractor import Workflow
 
+# Prefer the libyaml-backed dumper; fall back to pure Python when it is unavailable
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 
 def serialize_to_yaml(workflow: Workflow, output_path: str):
     """Convert workflow object to YAML format and save to file."""
@@ -17,9 +23,30 @@ def serialize_to_yaml(workflow: Workflow, output_path: str):
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write YAML file
-    with open(output_path, "w") as f:
-        yaml.dump(workflow_dict, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    # Write YAML file; libyaml encodes straight to UTF-8 bytes, skipping a
+    # round trip through a text stream
+    with open(output_path, "wb") as f:
+        yaml.dump(
+            workflow_dict,
+            f,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+            encoding="utf-8",
+        )
+
+    return output_path
+
+
+def serialize_to_json(workflow: Workflow, output_path: str):
+    """Save workflow as indented JSON, written by pydantic-core in one pass.
+
+    load_workflow reads .json files back with Workflow.model_validate_json.
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(workflow.model_dump_json(indent=2).encode())
 
     return output_path
 
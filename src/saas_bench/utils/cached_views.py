@@ -0,0 +1,43 @@
+"""Pydantic base model for values cached with functools.cached_property."""
+
+from functools import cached_property, lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> Tuple[str, ...]:
+    """Names of every functools.cached_property defined on cls or its bases."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class CachedViewsModel(BaseModel):
+    """Model with cached_property views derived from its fields.
+
+    cached_property stores values in the instance __dict__, which model_copy
+    copies, so a copy with updated fields drops them and computes its own.
+    Assigning a field (on models that aren't frozen) drops them too.
+    """
+
+    def model_copy(
+        self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False
+    ):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._drop_cached_views()
+        return copied
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._drop_cached_views()
+
+    def _drop_cached_views(self) -> None:
+        for name in _cached_property_names(type(self)):
+            self.__dict__.pop(name, None)
@@ -1,6 +1,14 @@
 """YAML workflow loader utility."""
 
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import ValidationError
@@ -8,6 +16,12 @@ from pydantic import ValidationError
 from ..domains.databricks.state import DatabricksState
 from ..tutorial_processor.workflow_extractor import Workflow
 
+# Prefer the libyaml-backed loader; fall back to pure Python when it is unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def validate_state_dict(
     state_dict: dict, state_name: str = "state"
@@ -26,12 +40,105 @@ def validate_state_dict(
         return False, f"Error validating {state_name}: {e}"
 
 
-def load_workflow(path: str, validate_states: bool = True) -> Workflow:
-    """Load and parse a workflow YAML file into a Pydantic model.
+@lru_cache(maxsize=None)
+def _state_schema_fingerprint() -> str:
+    """Hash of the DatabricksState JSON schema, so schema changes invalidate markers."""
+    schema = json.dumps(DatabricksState.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def _validation_marker(cache_dir: str, content: bytes) -> Path:
+    """Marker file recording that a workflow's states passed validation."""
+    digest = hashlib.sha256(content)
+    digest.update(_state_schema_fingerprint().encode())
+    return Path(cache_dir) / digest.hexdigest()
+
+
+def _intern_keys(data: Any) -> Any:
+    """Intern every string dict key in parsed YAML, in place; returns data.
+
+    Every workflow repeats the same few state keys ("catalogs", "name",
+    "owner", ...), so cached workflows then share one copy of each, and key
+    lookups can match on identity.
+    """
+    # YAML anchors and aliases can share a container, or make it contain
+    # itself, so visit each one only once
+    seen = set()
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (dict, list)):
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+        if isinstance(item, dict):
+            interned = {
+                sys.intern(key) if isinstance(key, str) else key: value
+                for key, value in item.items()
+            }
+            item.clear()
+            item.update(interned)
+            stack.extend(interned.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return data
+
+
+@dataclass(slots=True)
+class _CachedWorkflow:
+    """A parsed workflow and the file version it was parsed from."""
+
+    version: Tuple[int, int]  # (st_mtime_ns, st_size)
+    workflow: Workflow
+    states_validated: bool
+
+
+# Parsed workflows by absolute path; an entry is reused while the file's
+# mtime and size are unchanged
+_workflow_cache: Dict[str, _CachedWorkflow] = {}
+
+
+# Top-level workflow fields needed to list workflows
+SUMMARY_FIELDS = ("id", "title", "platforms", "description")
+
+# Workflow summaries by absolute path, with the file version they were read from
+_summary_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def clear_workflow_cache() -> None:
+    """Forget every workflow and summary loaded so far."""
+    _workflow_cache.clear()
+    _summary_cache.clear()
+
+
+def _validate_workflow_states(workflow: Workflow) -> None:
+    """Check initial_state and goal_state against the DatabricksState schema."""
+    if workflow.initial_state:
+        is_valid, error_msg = validate_state_dict(
+            workflow.initial_state, "initial_state"
+        )
+        if not is_valid:
+            raise ValueError(f"Invalid initial_state: {error_msg}")
+
+    if workflow.goal_state:
+        is_valid, error_msg = validate_state_dict(workflow.goal_state, "goal_state")
+        if not is_valid:
+            raise ValueError(f"Invalid goal_state: {error_msg}")
+
+
+def load_workflow(
+    path: str | Path, validate_states: bool = True, validation_cache: Optional[str] = None
+) -> Workflow:
+    """Load and parse a workflow YAML (or .json) file into a Pydantic model.
+
+    Parsed workflows are cached in memory and reused until the file's mtime or
+    size changes, so the returned object may be shared: treat it as read-only.
 
     Args:
-        path: Path to workflow YAML file
+        path: Path to workflow YAML file, or a JSON file from serialize_to_json
         validate_states: If True, validate initial_state and goal_state against DatabricksState schema
+        validation_cache: Directory of markers for workflow files whose states already
+            passed validation. Files with a marker skip state validation.
 
     Returns:
         Workflow object
@@ -41,47 +148,127 @@ def load_workflow(path: str, validate_states: bool = True) -> Workflow:
     """
     workflow_path = Path(path)
 
-    if not workflow_path.exists():
-        raise FileNotFoundError(f"Workflow file not found: {path}")
+    try:
+        stat = workflow_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Workflow file not found: {path}") from None
+
+    cache_key = os.path.abspath(workflow_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _workflow_cache.get(cache_key)
+    if cached is not None and cached.version == version:
+        if validate_states and not cached.states_validated:
+            _validate_workflow_states(cached.workflow)
+            cached.states_validated = True
+        return cached.workflow
 
-    with open(workflow_path, "r") as f:
-        workflow_dict = yaml.safe_load(f)
+    # Hand libyaml raw bytes so it does the decoding itself
+    with open(workflow_path, "rb") as f:
+        content = f.read()
 
     try:
-        workflow = Workflow(**workflow_dict)
+        if workflow_path.suffix == ".json":
+            # Parse and validate in a single pass inside pydantic-core (which
+            # also reuses one string per repeated key)
+            workflow = Workflow.model_validate_json(content)
+        else:
+            workflow_dict = _intern_keys(yaml.load(content, Loader=SafeLoader))
+            workflow = Workflow.model_validate(workflow_dict)
     except ValidationError as e:
         raise ValueError(f"Invalid workflow schema: {e}")
 
+    marker = None
+    if validate_states and validation_cache:
+        marker = _validation_marker(validation_cache, content)
+        if marker.exists():
+            validate_states = False
+
     # Validate state dictionaries if requested
     if validate_states:
-        if workflow.initial_state:
-            is_valid, error_msg = validate_state_dict(
-                workflow.initial_state, "initial_state"
-            )
-            if not is_valid:
-                raise ValueError(f"Invalid initial_state: {error_msg}")
-
-        if workflow.goal_state:
-            is_valid, error_msg = validate_state_dict(workflow.goal_state, "goal_state")
-            if not is_valid:
-                raise ValueError(f"Invalid goal_state: {error_msg}")
+        _validate_workflow_states(workflow)
+
+        if marker is not None:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+
+    # A file with a validation marker passed state validation on an earlier run
+    states_validated = validate_states or marker is not None
+    _workflow_cache[cache_key] = _CachedWorkflow(version, workflow, states_validated)
 
     return workflow
 
 
+def _load_workflow_or_none(path: Path) -> Optional[Workflow]:
+    """load_workflow, printing the error and returning None if the file fails."""
+    try:
+        return load_workflow(path)
+    except Exception as e:
+        print(f"Error loading {path}: {e}")
+        return None
+
+
 def load_all_workflows(directory: str = "workflows/databricks") -> list[Workflow]:
-    """Load all workflow YAML files from a directory."""
-    workflows = []
+    """Load all workflow YAML files from a directory, sorted by file name.
+
+    Files are read and parsed on a thread pool, which overlaps their I/O on a
+    cold start; once cached, each load is just a stat.
+    """
+    workflow_dir = Path(directory)
+
+    if not workflow_dir.exists():
+        return []
+
+    paths = sorted(workflow_dir.glob("*.yaml"))
+    if not paths:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+        results = list(executor.map(_load_workflow_or_none, paths))
+
+    return [workflow for workflow in results if workflow is not None]
+
+
+def load_workflow_summary(path: str | Path) -> Dict[str, Any]:
+    """Read the SUMMARY_FIELDS of a workflow file that passes schema validation.
+
+    On a cache miss the file goes through load_workflow (without state
+    validation), so only files the detail endpoints can serve are listed, and
+    their parsed workflows are already cached. Cached like load_workflow,
+    keyed by the file's mtime and size.
+
+    Raises:
+        ValueError: If the workflow schema is invalid
+    """
+    workflow_path = Path(path)
+    stat = workflow_path.stat()
+    cache_key = os.path.abspath(workflow_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _summary_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    workflow = load_workflow(workflow_path, validate_states=False)
+
+    summary = {field: getattr(workflow, field) for field in SUMMARY_FIELDS}
+    _summary_cache[cache_key] = (version, summary)
+    return summary
+
+
+def load_workflow_summaries(
+    directory: str = "workflows/databricks",
+) -> List[Dict[str, Any]]:
+    """Load the summary fields of every workflow YAML file in a directory."""
+    summaries = []
     workflow_dir = Path(directory)
 
     if not workflow_dir.exists():
-        return workflows
+        return summaries
 
     for yaml_file in workflow_dir.glob("*.yaml"):
         try:
-            workflow = load_workflow(str(yaml_file))
-            workflows.append(workflow)
+            summaries.append(load_workflow_summary(yaml_file))
         except Exception as e:
             print(f"Error loading {yaml_file}: {e}")
 
-    return workflows
+    return summaries
@@ -1,15 +1,17 @@
 """FastAPI application for workflow visualization."""
 
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from ..tutorial_processor.workflow_extractor import Workflow
-from ..utils.yaml_loader import load_all_workflows, load_workflow
-from .state_computer import compute_state_at_step
+from ..tutorial_processor.workflow_extractor import Workflow, WorkflowStep
+from ..utils.yaml_loader import load_workflow, load_workflow_summaries
+# The handlers serialize each state straight away, so they use the
+# non-copying accessors instead of the public compute_state_* functions
+from .state_computer import _state_at_step, _state_before_step
 
 app = FastAPI(title="SaaS-Bench Workflow Visualization API")
 
@@ -46,41 +48,68 @@ class WorkflowDetail(BaseModel):
     prerequisites: List[str]
     initial_state: Dict
     goal_state: Dict
-    steps: List[Dict]
+    steps: List[WorkflowStep]
 
 
-@app.get("/api/workflows", response_model=List[WorkflowSummary])
-async def list_workflows():
-    """List all available workflows."""
-    workflows_dir = Path("workflows/databricks")
-    workflows = load_all_workflows(str(workflows_dir))
-
-    return [
-        WorkflowSummary(
-            id=wf.id,
-            title=wf.title,
-            platforms=wf.platforms,
-            description=wf.description,
-        )
-        for wf in workflows
-    ]
+class StepIndexState(BaseModel):
+    """State of a workflow at a step index."""
 
+    workflow_id: str
+    step_index: int
+    state: Dict[str, Any]
 
-@app.get("/api/workflows/{workflow_id}", response_model=WorkflowDetail)
-async def get_workflow(workflow_id: str):
-    """Get full details of a specific workflow."""
-    workflows_dir = Path("workflows/databricks")
-    workflow_file = workflows_dir / f"{workflow_id}.yaml"
 
-    if not workflow_file.exists():
-        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
+class StepIdState(BaseModel):
+    """State of a workflow before or after a step."""
+
+    workflow_id: str
+    step_id: int
+    state: Dict[str, Any]
+
+
+# Serializes a WorkflowDetail straight to JSON bytes in pydantic-core, instead of
+# model_dump followed by FastAPI's jsonable_encoder and json.dumps
+_WORKFLOW_DETAIL_ADAPTER = TypeAdapter(WorkflowDetail)
+
+
+_WORKFLOWS_DIR = Path("workflows/databricks")
+
 
+def _get_workflow_or_404(workflow_id: str) -> Workflow:
+    """Load a workflow by ID, or raise the HTTP error the API reports for it."""
     try:
-        workflow = load_workflow(str(workflow_file))
+        # States are only displayed, so only the workflow schema is validated;
+        # the parsed workflow is cached until the file changes
+        return load_workflow(
+            _WORKFLOWS_DIR / f"{workflow_id}.yaml", validate_states=False
+        )
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=404, detail=f"Workflow {workflow_id} not found"
+        ) from None
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading workflow: {str(e)}")
 
-    return WorkflowDetail(
+
+# Handlers are plain functions on purpose: they read and parse YAML files, so
+# FastAPI runs them in its threadpool instead of blocking the event loop.
+# Every route declares a response_model: FastAPI then writes the JSON with
+# pydantic-core instead of walking the payload with jsonable_encoder
+
+@app.get("/api/workflows", response_model=List[WorkflowSummary])
+def list_workflows():
+    """List all available workflows."""
+    # Each file is validated once per version; later calls reuse its summary
+    return load_workflow_summaries(str(_WORKFLOWS_DIR))
+
+
+@app.get("/api/workflows/{workflow_id}", response_model=WorkflowDetail)
+def get_workflow(workflow_id: str):
+    """Get full details of a specific workflow."""
+    workflow = _get_workflow_or_404(workflow_id)
+
+    # The cached workflow's fields and step models are reused as they are
+    detail = WorkflowDetail.model_construct(
         id=workflow.id,
         source_url=workflow.source_url,
         title=workflow.title,
@@ -89,28 +118,25 @@ async def get_workflow(workflow_id: str):
         prerequisites=workflow.prerequisites,
         initial_state=workflow.initial_state,
         goal_state=workflow.goal_state,
-        steps=[step.model_dump() for step in workflow.steps],
+        steps=workflow.steps,
+    )
+    return Response(
+        content=_WORKFLOW_DETAIL_ADAPTER.dump_json(detail),
+        media_type="application/json",
     )
 
 
-@app.get("/api/workflows/{workflow_id}/state/{step_index}")
-async def get_state_at_step(workflow_id: str, step_index: int):
+@app.get(
+    "/api/workflows/{workflow_id}/state/{step_index}", response_model=StepIndexState
+)
+def get_state_at_step(workflow_id: str, step_index: int):
     """Get state at a specific step index.
 
     Args:
         workflow_id: The workflow ID
         step_index: Step index (0 = initial, 1-N = after step N, -1 = goal)
     """
-    workflows_dir = Path("workflows/databricks")
-    workflow_file = workflows_dir / f"{workflow_id}.yaml"
-
-    if not workflow_file.exists():
-        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
-
-    try:
-        workflow = load_workflow(str(workflow_file))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading workflow: {str(e)}")
+    workflow = _get_workflow_or_404(workflow_id)
 
     # Validate step_index
     max_step = len(workflow.steps)
@@ -120,7 +146,7 @@ async def get_state_at_step(workflow_id: str, step_index: int):
             detail=f"Step index must be between -1 (goal) and {max_step} (after last step)",
         )
 
-    state = compute_state_at_step(workflow, step_index)
+    state = _state_at_step(workflow, step_index)
 
     return {
         "workflow_id": workflow_id,
@@ -129,23 +155,14 @@ async def get_state_at_step(workflow_id: str, step_index: int):
     }
 
 
-@app.get("/api/workflows/{workflow_id}/state/before/{step_id}")
-async def get_state_before_step(workflow_id: str, step_id: int):
+@app.get(
+    "/api/workflows/{workflow_id}/state/before/{step_id}", response_model=StepIdState
+)
+def get_state_before_step(workflow_id: str, step_id: int):
     """Get state before a specific step."""
-    from .state_computer import compute_state_before_step
-
-    workflows_dir = Path("workflows/databricks")
-    workflow_file = workflows_dir / f"{workflow_id}.yaml"
+    workflow = _get_workflow_or_404(workflow_id)
 
-    if not workflow_file.exists():
-        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
-
-    try:
-        workflow = load_workflow(str(workflow_file))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading workflow: {str(e)}")
-
-    state = compute_state_before_step(workflow, step_id)
+    state = _state_before_step(workflow, step_id)
 
     return {
         "workflow_id": workflow_id,
@@ -154,23 +171,14 @@ async def get_state_before_step(workflow_id: str, step_id: int):
     }
 
 
-@app.get("/api/workflows/{workflow_id}/state/after/{step_id}")
-async def get_state_after_step(workflow_id: str, step_id: int):
+@app.get(
+    "/api/workflows/{workflow_id}/state/after/{step_id}", response_model=StepIdState
+)
+def get_state_after_step(workflow_id: str, step_id: int):
     """Get state after a specific step."""
-    from .state_computer import compute_state_after_step
-
-    workflows_dir = Path("workflows/databricks")
-    workflow_file = workflows_dir / f"{workflow_id}.yaml"
-
-    if not workflow_file.exists():
-        raise HTTPException(status_code=404, detail=f"Workflow {workflow_id} not found")
-
-    try:
-        workflow = load_workflow(str(workflow_file))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error loading workflow: {str(e)}")
+    workflow = _get_workflow_or_404(workflow_id)
 
-    state = compute_state_after_step(workflow, step_id)
+    state = _state_at_step(workflow, step_id)
 
     return {
         "workflow_id": workflow_id,
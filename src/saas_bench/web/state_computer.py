@@ -1,30 +1,33 @@
 """State computation logic for workflow visualization."""
 
+from bisect import bisect_left, bisect_right
 from copy import deepcopy
 from typing import Dict
 
 from ..tutorial_processor.workflow_extractor import Workflow
 
 
-def deep_merge(base: Dict, update: Dict) -> Dict:
-    """Deep merge two dictionaries, with update taking precedence.
+def _state_at_step(workflow: Workflow, step_index: int) -> Dict:
+    """compute_state_at_step without the copy: the state is shared, read-only."""
+    if step_index == -1:
+        return workflow.goal_state or {}
 
-    Args:
-        base: Base dictionary
-        update: Dictionary with updates to apply
+    if step_index == 0:
+        return workflow.initial_state or {}
 
-    Returns:
-        Merged dictionary
-    """
-    result = deepcopy(base)
+    # State after every step with step_id <= step_index
+    step_ids, states = workflow.cumulative_states
+    return states[bisect_right(step_ids, step_index)]
 
-    for key, value in update.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = deepcopy(value)
 
-    return result
+def _state_before_step(workflow: Workflow, step_id: int) -> Dict:
+    """compute_state_before_step without the copy: the state is shared, read-only."""
+    if step_id <= 1:
+        return workflow.initial_state or {}
+
+    # State after every step with step_id < step_id
+    step_ids, states = workflow.cumulative_states
+    return states[bisect_left(step_ids, step_id)]
 
 
 def compute_state_at_step(workflow: Workflow, step_index: int) -> Dict:
@@ -35,26 +38,9 @@ def compute_state_at_step(workflow: Workflow, step_index: int) -> Dict:
         step_index: Step index (0 = initial, 1-N = after step N, -1 = goal)
 
     Returns:
-        State dictionary at the specified step
+        State dictionary at the specified step (a copy, safe to modify)
     """
-    if step_index == -1:
-        # Return goal state
-        return deepcopy(workflow.goal_state) if workflow.goal_state else {}
-
-    if step_index == 0:
-        # Return initial state
-        return deepcopy(workflow.initial_state) if workflow.initial_state else {}
-
-    # Start with initial state
-    state = deepcopy(workflow.initial_state) if workflow.initial_state else {}
-
-    # Apply state changes from steps 1 through step_index
-    for step in workflow.steps:
-        if step.step_id <= step_index:
-            if step.expected_state_change:
-                state = deep_merge(state, step.expected_state_change)
-
-    return state
+    return deepcopy(_state_at_step(workflow, step_index))
 
 
 def compute_state_before_step(workflow: Workflow, step_id: int) -> Dict:
@@ -65,21 +51,9 @@ def compute_state_before_step(workflow: Workflow, step_id: int) -> Dict:
         step_id: The step ID to compute state before
 
     Returns:
-        State dictionary before the specified step
+        State dictionary before the specified step (a copy, safe to modify)
     """
-    if step_id <= 1:
-        return deepcopy(workflow.initial_state) if workflow.initial_state else {}
-
-    # Start with initial state
-    state = deepcopy(workflow.initial_state) if workflow.initial_state else {}
-
-    # Apply state changes from steps 1 through step_id - 1
-    for step in workflow.steps:
-        if step.step_id < step_id:
-            if step.expected_state_change:
-                state = deep_merge(state, step.expected_state_change)
-
-    return state
+    return deepcopy(_state_before_step(workflow, step_id))
 
 
 def compute_state_after_step(workflow: Workflow, step_id: int) -> Dict:
@@ -90,6 +64,6 @@ def compute_state_after_step(workflow: Workflow, step_id: int) -> Dict:
         step_id: The step ID to compute state after
 
     Returns:
-        State dictionary after the specified step
+        State dictionary after the specified step (a copy, safe to modify)
     """
     return compute_state_at_step(workflow, step_id)
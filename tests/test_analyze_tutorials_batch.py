@@ -0,0 +1,68 @@
+"""Tests for the batch tutorial analysis script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from saas_bench.tutorial_processor import workflow_extractor
+from saas_bench.tutorial_processor.workflow_extractor import Workflow
+
+SCRIPT_PATH = Path(__file__).parent.parent / "scripts" / "analyze_tutorials_batch.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location(
+        "analyze_tutorials_batch", SCRIPT_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class FakeGrokClient:
+    instances = 0
+
+    def __init__(self):
+        FakeGrokClient.instances += 1
+
+    def structured_output(self, user_prompt, system_prompt, response_model):
+        return Workflow(
+            id="llm-chosen-id",
+            source_url="",
+            title="Tutorial",
+            platforms=["Databricks"],
+            description="Test workflow",
+            goal_state={},
+            steps=[],
+        )
+
+
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    FakeGrokClient.instances = 0
+    monkeypatch.setattr(workflow_extractor, "GrokClient", FakeGrokClient)
+    workflow_extractor._shared_client.cache_clear()
+    yield
+    workflow_extractor._shared_client.cache_clear()
+
+
+def test_batch_assigns_consecutive_ids(tmp_path, monkeypatch):
+    script = load_script()
+    urls = [f"https://example.com/tutorial-{i}" for i in range(3)]
+
+    def scrape_all(urls, *args, **kwargs):
+        return {url: "Tutorial text" for url in urls}, 0
+
+    monkeypatch.setattr(script, "scrape_all", scrape_all)
+
+    results = script.process_tutorials_batch(urls, str(tmp_path), cache_dir=None)
+
+    assert [w["workflow_id"] for w in results["workflows_processed"]] == [
+        "databricks-001",
+        "databricks-002",
+        "databricks-003",
+    ]
+    assert (tmp_path / workflow_extractor.ID_COUNTER_FILE).read_text() == "4"
+    # Every extraction reuses one client
+    assert FakeGrokClient.instances == 1
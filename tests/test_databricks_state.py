@@ -6,6 +6,7 @@ from saas_bench.domains.databricks.state import (
     Catalog,
     Column,
     DatabricksState,
+    Permission,
     Schema,
     Table,
 )
@@ -42,6 +43,8 @@ def test_table_creation():
     assert table.table_name == "users"
     assert len(table.columns) == 2
     assert table.columns[0].name == "id"
+    assert table.key == "test_catalog.default.users"
+    assert DatabricksState.with_tables(table).tables == {table.key: table}
 
 
 def test_databricks_state():
@@ -57,6 +60,13 @@ def test_databricks_state():
     assert state.get_table_key("catalog1", "schema1", "table1") == "catalog1.schema1.table1"
 
 
+def test_empty_state_is_shared():
+    """Test DatabricksState.empty() returns one shared, empty instance."""
+    empty = DatabricksState.empty()
+    assert empty is DatabricksState.empty()
+    assert empty == DatabricksState()
+
+
 def test_state_immutability():
     """Test that state updates create new objects."""
     state1 = DatabricksState()
@@ -69,3 +79,31 @@ def test_state_immutability():
     assert len(state2.catalogs) == 1
     assert state1 is not state2
 
+
+def test_derived_views_follow_model_copy():
+    """Test cached column/permission views are not reused by updated copies."""
+    table = Table(
+        catalog_name="test_catalog",
+        schema_name="default",
+        table_name="users",
+        columns=[Column(name="id", type="INT")],
+        owner="admin",
+    )
+    assert table.columns_soa == (("id",), ("INT",))
+    wider = table.model_copy(
+        update={"columns": (*table.columns, Column(name="name", type="STRING"))}
+    )
+    assert wider.columns_soa == (("id", "name"), ("INT", "STRING"))
+
+    state = DatabricksState()
+    assert state.permission_keys == frozenset()
+    permission = Permission(
+        principal="analysts",
+        privilege="SELECT",
+        securable_type="TABLE",
+        securable_name="test_catalog.default.users",
+    )
+    granted = state.model_copy(update={"permissions": [permission]})
+    assert granted.permission_keys == {
+        ("analysts", "SELECT", "test_catalog.default.users")
+    }
@@ -2,6 +2,7 @@
 
 import pytest
 
+from saas_bench.domains.databricks.registry import validate_tool_args
 from saas_bench.domains.databricks.state import DatabricksState
 from saas_bench.domains.databricks import tools
 
@@ -72,6 +73,36 @@ def test_create_table():
     assert "test_catalog.default.users" in new_state.tables
 
 
+def test_create_table_rejects_invalid_column():
+    """Test that bad column fields are rejected and the state still round-trips."""
+    state = DatabricksState()
+    state, _ = tools.create_catalog(state, {"catalog_name": "test_catalog"})
+    state, _ = tools.create_schema(
+        state, {"catalog_name": "test_catalog", "schema_name": "default"}
+    )
+
+    for column in (
+        {"name": "id", "type": 5},
+        {"name": "id", "type": "INT", "nullable": "no"},
+        {"name": "id", "type": "INT", "comment": 1},
+    ):
+        new_state, response = tools.create_table(
+            state,
+            {
+                "catalog_name": "test_catalog",
+                "schema_name": "default",
+                "table_name": "users",
+                "columns": [column],
+            },
+        )
+
+        assert "error" in response
+        assert new_state is state
+
+    restored = DatabricksState.model_validate(state.model_dump())
+    assert restored == state
+
+
 def test_insert_into_table():
     """Test inserting data into a table."""
     state = DatabricksState()
@@ -137,3 +168,23 @@ def test_grant_privilege():
     assert len(new_state.permissions) == 1
     assert new_state.permissions[0].privilege == "SELECT"
 
+
+def test_validate_tool_args():
+    """Test tool arguments are checked against the compiled parameter schemas."""
+    assert validate_tool_args("create_catalog", {"catalog_name": "main"}) == (True, "")
+    assert validate_tool_args("create_catalog", {}) == (
+        False,
+        "args.catalog_name is required",
+    )
+    valid, error = validate_tool_args(
+        "create_table",
+        {
+            "catalog_name": "main",
+            "schema_name": "default",
+            "table_name": "users",
+            "columns": [{"name": "id", "type": 1}],
+        },
+    )
+    assert valid is False
+    assert error == "args.columns[0].type must be of type string"
+    assert validate_tool_args("unknown_tool", {})[0] is False
@@ -1,6 +1,8 @@
 """Tests for Environment class."""
 
-from saas_bench.core.environment import Environment
+import json
+
+from saas_bench.core.environment import Environment, UserMessage
 from saas_bench.domains.databricks.state import DatabricksState
 
 
@@ -28,8 +30,39 @@ def test_conversation_history():
 
     history = env.get_conversation_history()
     assert len(history) == 2
-    assert history[0]["type"] == "user_message"
-    assert history[1]["type"] == "tool_call"
+    assert history[0].type == "user_message"
+    assert history[1].type == "tool_call"
+    assert history[1].tool == "create_catalog"
+    assert history[1].to_dict()["args"] == {"catalog_name": "test_catalog"}
+
+
+def test_conversation_history_is_read_only_view():
+    """Test history getter returns a live view and copies are independent."""
+    env = Environment()
+    history = env.get_conversation_history()
+    assert not hasattr(history, "append")
+
+    env.add_agent_message("Done")
+    assert len(history) == 1
+    assert history[-1].content == "Done"
+
+    copied = env.copy_conversation_history()
+    copied.append(UserMessage("Thanks"))
+    assert len(env.get_conversation_history()) == 1
+
+
+def test_state_snapshots_support_slicing():
+    """Test snapshot views can be sliced like the list they used to be."""
+    env = Environment(record_snapshots=True)
+    for name in ("a", "b", "c"):
+        env.execute_tool("create_catalog", {"catalog_name": name})
+
+    snapshots = env.get_state_snapshots()
+    recent = snapshots[-2:]
+    assert len(recent) == 2
+    assert recent[-1] is env.get_state()
+    assert set(recent[0].catalogs) == {"a", "b"}
+    assert snapshots[::-1][0] is snapshots[-1]
 
 
 def test_reset():
@@ -50,4 +83,5 @@ def test_get_tool_specs():
 
     assert len(specs) > 0
     assert any(spec["name"] == "create_catalog" for spec in specs)
+    assert json.loads(json.dumps(specs)) == list(specs)
 
@@ -1,87 +1,140 @@
 """Tests for evaluation logic."""
 
-from saas_bench.core.evaluation import evaluate_task
-from saas_bench.domains.databricks.state import Catalog, DatabricksState, Table
-from saas_bench.domains.databricks.state import Column
-
-
-def test_evaluation_success():
-    """Test successful evaluation."""
-    # Create goal state
-    goal_state = DatabricksState()
-    goal_state = goal_state.model_copy(
-        update={
-            "catalogs": {
-                "test_catalog": Catalog(name="test_catalog", owner="admin"),
-            }
-        }
-    )
+import json
 
-    # Create final state matching goal
-    final_state = DatabricksState()
-    final_state = final_state.model_copy(
-        update={
-            "catalogs": {
-                "test_catalog": Catalog(name="test_catalog", owner="admin"),
-            }
-        }
-    )
+import pytest
 
-    result = evaluate_task(final_state, goal_state)
-    assert result.success is True
-    assert result.score == 1.0
+from saas_bench.core.evaluation import GoalPlan, evaluate_task
+from saas_bench.domains.databricks.state import (
+    Catalog,
+    Column,
+    DatabricksState,
+    Table,
+)
+
+# State models are frozen, so tests can share these instead of rebuilding them
+TEST_CATALOG = Catalog(name="test_catalog", owner="admin")
+ID_COLUMN = Column(name="id", type="INT")
+NAME_COLUMN = Column(name="name", type="STRING")
 
+USERS_KEY = "test_catalog.default.users"
+USERS_TABLE = Table(
+    catalog_name="test_catalog",
+    schema_name="default",
+    table_name="users",
+    columns=[ID_COLUMN, NAME_COLUMN],
+    owner="admin",
+)
+CATALOG_STATE = DatabricksState(catalogs={"test_catalog": TEST_CATALOG})
+EMPTY_STATE = DatabricksState.empty()
 
-def test_evaluation_missing_resource():
-    """Test evaluation with missing resources."""
-    # Create goal state with catalog
-    goal_state = DatabricksState()
-    goal_state = goal_state.model_copy(
-        update={
-            "catalogs": {
-                "test_catalog": Catalog(name="test_catalog", owner="admin"),
+# The users table with a wrong column type, validated from one nested payload
+MISMATCHED_USERS_STATE = DatabricksState.model_validate(
+    {
+        "tables": {
+            USERS_KEY: {
+                "catalog_name": "test_catalog",
+                "schema_name": "default",
+                "table_name": "users",
+                "columns": [{"name": "id", "type": "STRING"}],
+                "owner": "admin",
             }
         }
-    )
+    }
+)
 
-    # Create final state without catalog
-    final_state = DatabricksState()
+EVALUATION_CASES = [
+    pytest.param(
+        DatabricksState(catalogs={"test_catalog": TEST_CATALOG}),
+        CATALOG_STATE,
+        "full",
+        True,
+        None,
+        id="success",
+    ),
+    # Only the failure matters here, so stop at the first difference
+    pytest.param(
+        EMPTY_STATE,
+        CATALOG_STATE,
+        "first_diff",
+        False,
+        "missing_catalogs",
+        id="missing_resource",
+    ),
+    pytest.param(
+        MISMATCHED_USERS_STATE,
+        DatabricksState.with_tables(USERS_TABLE),
+        "full",
+        False,
+        "incorrect_tables",
+        id="table_schema_mismatch",
+    ),
+]
 
-    result = evaluate_task(final_state, goal_state)
-    assert result.success is False
-    assert result.score < 1.0
-    assert len(result.differences["missing_catalogs"]) > 0
 
+@pytest.mark.parametrize(
+    "final_state, goal_state, mode, success, difference", EVALUATION_CASES
+)
+def test_evaluation(final_state, goal_state, mode, success, difference):
+    """Test evaluation succeeds, or fails with the expected difference."""
+    result = evaluate_task(final_state, goal_state, mode=mode)
+    assert result.success is success
+    assert (result.score == 1.0) is success
+    if difference:
+        assert len(result.differences[difference]) > 0
 
-def test_evaluation_table_schema_mismatch():
-    """Test evaluation with incorrect table schema."""
-    # Create goal state with table
-    goal_state = DatabricksState()
+
+def test_evaluation_of_goal_against_itself():
+    """Test a final state sharing the goal's resources passes every check."""
     goal_table = Table(
         catalog_name="test_catalog",
         schema_name="default",
         table_name="users",
-        columns=[Column(name="id", type="INT"), Column(name="name", type="STRING")],
+        columns=[ID_COLUMN, NAME_COLUMN],
+        data=[{"id": 1, "name": "Ada"}],
         owner="admin",
     )
-    goal_state = goal_state.model_copy(
-        update={"tables": {"test_catalog.default.users": goal_table}}
+    goal_state = DatabricksState(
+        catalogs={"test_catalog": TEST_CATALOG},
+        tables={"test_catalog.default.users": goal_table},
+    )
+
+    result = evaluate_task(goal_state, goal_state)
+    assert result.success is True
+    assert result.score == 1.0
+    assert "Table 'test_catalog.default.users' has data inserted" in (
+        result.milestones_achieved
     )
 
-    # Create final state with different schema
-    final_state = DatabricksState()
-    final_table = Table(
+
+def test_evaluation_with_goal_plan():
+    """Test a precomputed goal plan can be reused across final states."""
+    goal_state = CATALOG_STATE
+    plan = GoalPlan.from_state(goal_state)
+
+    matching = goal_state.model_copy()
+    assert evaluate_task(matching, plan) == evaluate_task(matching, goal_state)
+    assert evaluate_task(matching, plan).success is True
+    assert evaluate_task(EMPTY_STATE, plan).success is False
+
+
+def test_evaluation_fast_mode_stops_on_missing_catalog():
+    """Test fast mode returns early once a goal catalog is missing."""
+    goal_table = Table(
         catalog_name="test_catalog",
         schema_name="default",
         table_name="users",
-        columns=[Column(name="id", type="STRING")],  # Wrong type
+        columns=[ID_COLUMN],
         owner="admin",
     )
-    final_state = final_state.model_copy(
-        update={"tables": {"test_catalog.default.users": final_table}}
+    goal_state = DatabricksState(
+        catalogs={"test_catalog": TEST_CATALOG},
+        tables={"test_catalog.default.users": goal_table},
     )
 
-    result = evaluate_task(final_state, goal_state)
+    result = evaluate_task(EMPTY_STATE, goal_state, mode="fast")
     assert result.success is False
-    assert len(result.differences["incorrect_tables"]) > 0
-
+    assert result.score == 0.0
+    assert result.differences["missing_catalogs"] == ["test_catalog"]
+    assert result.differences["missing_tables"] == []
+    assert json.loads(json.dumps(result.differences)) == result.differences
@@ -0,0 +1,94 @@
+"""Tests for the Grok LLM client."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from saas_bench.tutorial_processor.llm_client import GrokClient
+
+
+def make_response(content):
+    message = SimpleNamespace(content=content)
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeAsyncCompletions:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, model, messages):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return make_response(f"{messages[0]['content']}|{messages[-1]['content']}")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("GROK_API_KEY", "test-key")
+    return GrokClient()
+
+
+def test_async_client_is_created_on_first_use(client):
+    """Test sync-only use of the client never builds the async SDK client."""
+    assert "async_client" not in vars(client)
+    assert client.async_client is client.async_client
+
+
+def test_chat_completion_many_keeps_order_and_limit(client):
+    """Test concurrent completions come back in prompt order, within the limit."""
+    completions = FakeAsyncCompletions()
+    client.async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    prompts = [f"prompt {i}" for i in range(5)]
+    results = asyncio.run(
+        client.chat_completion_many(prompts, system="system", concurrency=2)
+    )
+
+    assert results == [f"system|{prompt}" for prompt in prompts]
+    assert completions.max_in_flight == 2
+
+
+class FlakyParseCompletions:
+    """beta completions whose parse fails with AttributeError on the first call."""
+
+    def __init__(self, parsed):
+        self.parsed = parsed
+        self.calls = 0
+
+    def parse(self, model, messages, response_format):
+        self.calls += 1
+        if self.calls == 1:
+            raise AttributeError("response has no parsed attribute")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(parsed=self.parsed))]
+        )
+
+
+class JsonModeCompletions:
+    def create(self, model, messages, response_format):
+        return make_response('{"answer": "from json mode"}')
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+def test_parse_errors_fall_back_for_that_call_only(client):
+    """Test a failed structured-output call uses JSON mode without disabling parse."""
+    parse = FlakyParseCompletions(Answer(answer="from parse"))
+    client.client = SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=parse)),
+        chat=SimpleNamespace(completions=JsonModeCompletions()),
+    )
+
+    first = client.structured_output("question", "system", Answer)
+    second = client.structured_output("question", "system", Answer)
+
+    assert first == Answer(answer="from json mode")
+    assert second == Answer(answer="from parse")
+    assert parse.calls == 2
@@ -0,0 +1,60 @@
+"""Tests for tutorial page fetching."""
+
+import pytest
+import requests
+
+from saas_bench.tutorial_processor import scraper
+
+
+def make_http_error(status: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status
+    return requests.HTTPError(f"{status} error", response=response)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(scraper.time, "sleep", delays.append)
+    return delays
+
+
+def fail_with(monkeypatch, error: Exception) -> None:
+    def get(url, timeout):
+        raise error
+
+    monkeypatch.setattr(scraper._SESSION, "get", get)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.exceptions.MissingSchema("No scheme supplied"),
+        requests.exceptions.InvalidURL("Invalid URL"),
+        make_http_error(404),
+    ],
+)
+def test_fetch_page_does_not_retry_permanent_errors(monkeypatch, sleeps, error):
+    """Test errors that would fail again are raised without waiting."""
+    fail_with(monkeypatch, error)
+
+    with pytest.raises(ValueError, match="Failed to fetch URL"):
+        scraper.fetch_page("example.com/tutorial")
+    assert sleeps == []
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        requests.ConnectionError("connection reset"),
+        requests.Timeout("timed out"),
+        make_http_error(503),
+    ],
+)
+def test_fetch_page_retries_transient_errors(monkeypatch, sleeps, error):
+    """Test network errors and retryable statuses back off before failing."""
+    fail_with(monkeypatch, error)
+
+    with pytest.raises(ValueError, match="Failed to fetch URL"):
+        scraper.fetch_page("https://example.com/tutorial", retries=3, backoff=1.0)
+    assert sleeps == [1.0, 2.0]
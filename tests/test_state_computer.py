@@ -0,0 +1,100 @@
+"""Tests for workflow state computation."""
+
+from saas_bench.tutorial_processor.workflow_extractor import Workflow, WorkflowStep
+from saas_bench.web.state_computer import (
+    compute_state_after_step,
+    compute_state_at_step,
+    compute_state_before_step,
+)
+
+INITIAL_STATE = {"catalogs": {"main": {"name": "main"}}}
+
+
+def make_step(step_id: int, change: dict) -> WorkflowStep:
+    return WorkflowStep(
+        step_id=step_id,
+        description=f"Step {step_id}",
+        method="sql",
+        api_call={"tool": "create_schema"},
+        expected_state_change=change,
+    )
+
+
+def owner(state: dict) -> str:
+    return state["catalogs"]["main"]["owner"]
+
+
+def make_workflow(*steps: WorkflowStep) -> Workflow:
+    return Workflow(
+        id="databricks-test",
+        source_url="https://example.com/tutorial",
+        title="Test",
+        platforms=["Databricks"],
+        description="Test workflow",
+        initial_state=INITIAL_STATE,
+        goal_state={"catalogs": {}},
+        steps=list(steps),
+    )
+
+
+def test_computed_states_are_independent_copies():
+    """Test modifying a returned state doesn't leak into later results."""
+    workflow = make_workflow(
+        make_step(1, {"schemas": {"main.default": {"owner": "admin"}}})
+    )
+
+    state = compute_state_at_step(workflow, 1)
+    state["catalogs"]["main"]["name"] = "changed"
+    state["schemas"].clear()
+
+    assert compute_state_at_step(workflow, 1) == {
+        "catalogs": {"main": {"name": "main"}},
+        "schemas": {"main.default": {"owner": "admin"}},
+    }
+    assert workflow.initial_state == INITIAL_STATE
+
+
+def test_states_follow_step_ids_out_of_order_and_sparse():
+    """Test steps apply in step_id order, and gaps in step_ids are skipped."""
+    workflow = make_workflow(
+        make_step(5, {"catalogs": {"main": {"owner": "bob"}}}),
+        make_step(2, {"catalogs": {"main": {"owner": "alice"}}}),
+        make_step(3, {}),
+    )
+
+    assert compute_state_at_step(workflow, 0) == INITIAL_STATE
+    assert compute_state_at_step(workflow, 1) == INITIAL_STATE
+    assert owner(compute_state_at_step(workflow, 2)) == "alice"
+    assert owner(compute_state_at_step(workflow, 4)) == "alice"
+    assert compute_state_after_step(workflow, 5) == {
+        "catalogs": {"main": {"name": "main", "owner": "bob"}}
+    }
+    assert compute_state_at_step(workflow, -1) == {"catalogs": {}}
+
+
+def test_state_before_step():
+    """Test the state before a step includes only steps with smaller step_ids."""
+    workflow = make_workflow(
+        make_step(4, {"catalogs": {"main": {"owner": "bob"}}}),
+        make_step(2, {"catalogs": {"main": {"owner": "alice"}}}),
+    )
+
+    assert compute_state_before_step(workflow, 1) == INITIAL_STATE
+    assert compute_state_before_step(workflow, 2) == INITIAL_STATE
+    assert owner(compute_state_before_step(workflow, 3)) == "alice"
+    assert owner(compute_state_before_step(workflow, 4)) == "alice"
+    assert owner(compute_state_before_step(workflow, 5)) == "bob"
+
+
+def test_cached_states_follow_updated_steps():
+    """Test copies with new steps, and reassigned steps, recompute their states."""
+    workflow = make_workflow(make_step(1, {"catalogs": {"main": {"owner": "alice"}}}))
+    assert owner(compute_state_at_step(workflow, 1)) == "alice"
+
+    changed = make_step(1, {"catalogs": {"main": {"owner": "bob"}}})
+    copied = workflow.model_copy(update={"steps": [changed]})
+    assert owner(compute_state_at_step(copied, 1)) == "bob"
+    assert owner(compute_state_at_step(workflow, 1)) == "alice"
+
+    workflow.steps = [changed]
+    assert owner(compute_state_at_step(workflow, 1)) == "bob"
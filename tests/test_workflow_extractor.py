@@ -0,0 +1,149 @@
+"""Tests for concurrent and batched workflow extraction."""
+
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from saas_bench.tutorial_processor import workflow_extractor
+from saas_bench.tutorial_processor.workflow_extractor import (
+    Workflow,
+    WorkflowBatch,
+    extract_workflows_batch,
+    extract_workflows_marshaled,
+)
+
+
+def make_workflow(source_url: str) -> Workflow:
+    return Workflow(
+        id="llm-chosen-id",
+        source_url=source_url,
+        title="Tutorial",
+        platforms=["Databricks"],
+        description="Test workflow",
+        goal_state={},
+        steps=[],
+    )
+
+
+class FakeGrokClient:
+    """Answers from the tutorial URLs in the prompt.
+
+    A "fail" URL makes the request raise, and a "short" URL makes a batch
+    response leave out its last workflow.
+    """
+
+    prompts = []
+
+    def structured_output(self, user_prompt, system_prompt, response_model):
+        FakeGrokClient.prompts.append(user_prompt)
+        urls = re.findall(r"Tutorial URL: (\S+)", user_prompt)
+        if any("fail" in url for url in urls):
+            raise RuntimeError(f"extraction failed for {urls}")
+        if response_model is WorkflowBatch:
+            workflows = [make_workflow(url) for url in urls]
+            if any("short" in url for url in urls):
+                workflows.pop()
+            return WorkflowBatch(workflows=workflows)
+        return make_workflow(urls[0])
+
+
+@pytest.fixture(autouse=True)
+def fake_client(monkeypatch):
+    FakeGrokClient.prompts = []
+    monkeypatch.setattr(workflow_extractor, "GrokClient", FakeGrokClient)
+
+
+def test_batch_assigns_consecutive_ids_in_input_order(tmp_path):
+    """Test successful workflows get consecutive IDs after existing files."""
+    (tmp_path / "databricks-001.yaml").write_text("")
+    tutorials = [
+        ("text", "https://example.com/a"),
+        ("text", "https://example.com/fail"),
+        ("text", "https://example.com/b"),
+        ("text", "https://example.com/c"),
+    ]
+
+    results = asyncio.run(
+        extract_workflows_batch(tutorials, str(tmp_path), concurrency=2)
+    )
+
+    assert isinstance(results[1], RuntimeError)
+    workflows = [results[0], results[2], results[3]]
+    assert [w.id for w in workflows] == [
+        "databricks-002",
+        "databricks-003",
+        "databricks-004",
+    ]
+    assert [w.source_url for w in workflows] == [
+        "https://example.com/a",
+        "https://example.com/b",
+        "https://example.com/c",
+    ]
+    assert (tmp_path / workflow_extractor.ID_COUNTER_FILE).read_text() == "5"
+
+
+def test_batch_with_only_failures_reserves_no_ids(tmp_path):
+    """Test a batch where every extraction fails leaves the counter alone."""
+    results = asyncio.run(
+        extract_workflows_batch([("text", "https://example.com/fail")], str(tmp_path))
+    )
+
+    assert isinstance(results[0], RuntimeError)
+    assert not (tmp_path / workflow_extractor.ID_COUNTER_FILE).exists()
+
+
+def test_concurrent_batches_share_the_id_counter(tmp_path):
+    """Test batches run from several threads never hand out the same ID."""
+    def run_batch(batch: int):
+        tutorials = [("text", f"https://example.com/{batch}-{i}") for i in range(3)]
+        return asyncio.run(extract_workflows_batch(tutorials, str(tmp_path)))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batches = list(executor.map(run_batch, range(4)))
+
+    ids = sorted(workflow.id for results in batches for workflow in results)
+    assert ids == [f"databricks-{number:03d}" for number in range(1, 13)]
+    for results in batches:
+        numbers = [int(workflow.id.rsplit("-", 1)[1]) for workflow in results]
+        assert numbers == list(range(numbers[0], numbers[0] + 3))
+
+
+def test_marshaled_splits_tutorials_into_batches(tmp_path):
+    """Test tutorials are sent batch_size at a time and come back in order."""
+    tutorials = [("text", f"https://example.com/{i}") for i in range(5)]
+
+    results = asyncio.run(
+        extract_workflows_marshaled(tutorials, str(tmp_path), batch_size=2)
+    )
+
+    assert len(FakeGrokClient.prompts) == 3
+    assert sorted(
+        len(re.findall("Tutorial URL:", prompt)) for prompt in FakeGrokClient.prompts
+    ) == [1, 2, 2]
+    assert [w.source_url for w in results] == [url for _, url in tutorials]
+    assert [w.id for w in results] == [f"databricks-{i:03d}" for i in range(1, 6)]
+
+
+def test_marshaled_failed_batch_fails_each_of_its_tutorials(tmp_path):
+    """Test a batch's exception is reported for every tutorial in it."""
+    tutorials = [
+        ("text", "https://example.com/a"),
+        ("text", "https://example.com/b"),
+        ("text", "https://example.com/fail"),
+        ("text", "https://example.com/c"),
+        ("text", "https://example.com/d"),
+        ("text", "https://example.com/short"),
+    ]
+
+    results = asyncio.run(
+        extract_workflows_marshaled(tutorials, str(tmp_path), batch_size=2)
+    )
+
+    assert [w.id for w in results[:2]] == ["databricks-001", "databricks-002"]
+    assert isinstance(results[2], RuntimeError)
+    assert results[3] is results[2]
+    assert isinstance(results[4], ValueError)
+    assert "Expected 2 workflows, got 1" in str(results[4])
+    assert results[5] is results[4]
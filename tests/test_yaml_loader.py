@@ -0,0 +1,108 @@
+"""Tests for the workflow YAML loader."""
+
+import os
+
+import pytest
+
+from saas_bench.tutorial_processor.workflow_serializer import serialize_to_json
+from saas_bench.utils.yaml_loader import (
+    clear_workflow_cache,
+    load_workflow,
+    load_workflow_summaries,
+)
+
+WORKFLOW_YAML = """\
+id: databricks-test
+source_url: https://example.com/tutorial
+title: {title}
+platforms:
+- Databricks
+description: Test workflow
+goal_state:
+  catalogs: {{}}
+steps: []
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_workflow_cache()
+    yield
+    clear_workflow_cache()
+
+
+def test_load_workflow_reuses_unchanged_file(tmp_path):
+    """Test a workflow is parsed once while its file is unchanged."""
+    path = tmp_path / "databricks-test.yaml"
+    path.write_text(WORKFLOW_YAML.format(title="First"))
+
+    workflow = load_workflow(path)
+    assert workflow.title == "First"
+    assert load_workflow(str(path)) is workflow
+
+
+def test_load_workflow_reloads_modified_file(tmp_path):
+    """Test a changed file is parsed again."""
+    path = tmp_path / "databricks-test.yaml"
+    path.write_text(WORKFLOW_YAML.format(title="First"))
+    workflow = load_workflow(path)
+
+    path.write_text(WORKFLOW_YAML.format(title="Second title"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_workflow(path)
+    assert reloaded is not workflow
+    assert reloaded.title == "Second title"
+
+
+def test_empty_workflow_file_raises_value_error(tmp_path):
+    """Test files without a mapping are rejected with a ValueError."""
+    path = tmp_path / "databricks-test.yaml"
+    path.write_text("# nothing here yet\n")
+
+    with pytest.raises(ValueError, match="Invalid workflow schema"):
+        load_workflow(path)
+
+
+def test_self_referencing_anchor_loads(tmp_path):
+    """Test an alias pointing back into its own anchor doesn't hang the loader."""
+    path = tmp_path / "databricks-test.yaml"
+    path.write_text(
+        WORKFLOW_YAML.format(title="First").replace(
+            "catalogs: {}", "catalogs: &catalogs\n    self: *catalogs"
+        )
+    )
+
+    workflow = load_workflow(path, validate_states=False)
+    catalogs = workflow.goal_state["catalogs"]
+    assert catalogs["self"] is catalogs
+
+
+def test_load_workflow_summaries(tmp_path):
+    """Test summaries carry only the listing fields and skip invalid files."""
+    (tmp_path / "databricks-test.yaml").write_text(WORKFLOW_YAML.format(title="First"))
+    (tmp_path / "broken.yaml").write_text("id: broken\n")
+    (tmp_path / "nosteps.yaml").write_text(
+        "id: nosteps\ntitle: No steps\nplatforms: [Databricks]\ndescription: d\n"
+    )
+
+    assert load_workflow_summaries(str(tmp_path)) == [
+        {
+            "id": "databricks-test",
+            "title": "First",
+            "platforms": ["Databricks"],
+            "description": "Test workflow",
+        }
+    ]
+
+
+def test_load_workflow_from_json(tmp_path):
+    """Test a workflow saved with serialize_to_json loads back unchanged."""
+    yaml_path = tmp_path / "databricks-test.yaml"
+    yaml_path.write_text(WORKFLOW_YAML.format(title="First"))
+    workflow = load_workflow(yaml_path)
+
+    json_path = serialize_to_json(workflow, str(tmp_path / "databricks-test.json"))
+
+    assert load_workflow(json_path) == workflow